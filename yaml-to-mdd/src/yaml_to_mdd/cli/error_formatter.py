@@ -57,13 +57,13 @@ class ErrorFormatter:
             source_content: Source content for context snippets.
 
         """
-        if result.is_valid and not result.warnings:
+        if result.is_valid and not result.warning_count:
             self._print_success("Validation passed")
             return
 
         # Summary panel
-        error_count = len(result.errors)
-        warning_count = len(result.warnings)
+        error_count = result.error_count
+        warning_count = result.warning_count
 
         summary = self._build_summary(error_count, warning_count, source_path)
         self.console.print(summary)
@@ -160,7 +160,7 @@ def validate(
     result = validator.validate(doc)
 
     # Format and display validation results
-    if not result.is_valid or result.warnings:
+    if not result.is_valid or result.warning_count:
         source_content = input_file.read_text() if verbose else None
 
         if output_format == "table":
@@ -176,9 +176,9 @@ def validate(
             raise typer.Exit(code=1)
 
     if not quiet:
-        if result.is_valid and not result.warnings:
+        if result.is_valid and not result.warning_count:
             console.print(f"\n[bold green]✓ {input_file.name} is valid[/bold green]\n")
-        elif result.is_valid and result.warnings:
+        elif result.is_valid and result.warning_count:
             console.print(
                 f"\n[bold yellow]⚠ {input_file.name} is valid with warnings[/bold yellow]\n"
             )
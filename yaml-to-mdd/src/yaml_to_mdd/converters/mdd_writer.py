@@ -7,7 +7,7 @@ outer envelope and FlatBuffers for the diagnostic data payload.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from yaml_to_mdd.converters.flatbuffers_converter import (
     DoIPAddressingConfig,
@@ -22,6 +22,21 @@ if TYPE_CHECKING:
 # "MDD version 0      \0" - 20 bytes total (ASCII)
 FILE_MAGIC = b"MDD version 0      \x00"
 
+# gzip backend, resolved once: ISA-L's SIMD deflate when the optional ``isal``
+# extra is installed, otherwise the stdlib. Both emit standard gzip streams that
+# any gzip reader accepts, but the compressed bytes differ, so gzip-compressed
+# MDD output depends on which backend the environment provides.
+try:
+    from isal import igzip as _gzip
+
+    # Level 1: ISA-L's fast setting, favouring write speed over ratio
+    _GZIP_LEVEL = 1
+except ImportError:
+    import gzip as _gzip  # type: ignore[no-redef]
+
+    # The stdlib default, so output without isal is unchanged
+    _GZIP_LEVEL = 9
+
 
 class MDDWriter:
     """Write MDD files combining FlatBuffers data with Protobuf container.
@@ -36,6 +51,9 @@ class MDDWriter:
 
     Or for in-memory conversion:
         mdd_bytes = writer.write_bytes(ir_database)
+
+    Or to an open binary stream:
+        size = writer.write_to(stream, ir_database)
     """
 
     def __init__(
@@ -50,6 +68,8 @@ class MDDWriter:
             version: MDD file format version string.
             compression: Compression algorithm ("lzma", "zstd", "gzip", or None).
                 Defaults to "lzma" for compatibility with classic-diagnostic-adapter.
+                "gzip" uses ISA-L when the ``isal`` extra is installed, so its
+                output bytes (not the decompressed payload) vary by environment.
 
         """
         self._version = version
@@ -70,18 +90,51 @@ class MDDWriter:
             doip_addressing: Optional DoIP addressing configuration.
 
         """
-        mdd_bytes = self.write_bytes(db, doip_addressing)
+        # Serialize before opening, so a failed conversion leaves any existing file intact
+        payload = self._serialize(db, doip_addressing, None)
 
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, "wb") as f:
-            f.write(mdd_bytes)
+            f.write(FILE_MAGIC)
+            f.write(payload)
+
+    def write_to(
+        self,
+        stream: BinaryIO,
+        db: IRDatabase,
+        doip_addressing: DoIPAddressingConfig | None = None,
+        fbs_bytes: bytes | None = None,
+    ) -> int:
+        """Write IR database as MDD to an open binary stream.
+
+        The magic header and the Protobuf payload are written separately, so
+        no joined copy of the whole file is built in memory.
+
+        Args:
+        ----
+            stream: Writable binary stream (file object or ``io.BytesIO``).
+            db: The IR database to convert.
+            doip_addressing: Optional DoIP addressing configuration.
+            fbs_bytes: FlatBuffers payload already built from ``db``. When given,
+                the conversion step is skipped and ``doip_addressing`` is ignored.
+
+        Returns:
+        -------
+            Number of bytes written.
+
+        """
+        payload = self._serialize(db, doip_addressing, fbs_bytes)
+        stream.write(FILE_MAGIC)
+        stream.write(payload)
+        return len(FILE_MAGIC) + len(payload)
 
     def write_bytes(
         self,
         db: IRDatabase,
         doip_addressing: DoIPAddressingConfig | None = None,
+        fbs_bytes: bytes | None = None,
     ) -> bytes:
         """Convert IR database to MDD bytes without writing to file.
 
@@ -89,15 +142,39 @@ class MDDWriter:
         ----
             db: The IR database to convert.
             doip_addressing: Optional DoIP addressing configuration.
+            fbs_bytes: FlatBuffers payload already built from ``db``. When given,
+                the conversion step is skipped and ``doip_addressing`` is ignored.
 
         Returns:
         -------
             MDD file as bytes (Protobuf-serialized container with magic header).
 
+        """
+        return FILE_MAGIC + self._serialize(db, doip_addressing, fbs_bytes)
+
+    def _serialize(
+        self,
+        db: IRDatabase,
+        doip_addressing: DoIPAddressingConfig | None,
+        fbs_bytes: bytes | None,
+    ) -> bytes:
+        """Build the Protobuf-serialized MDD container, without the magic header.
+
+        Args:
+        ----
+            db: The IR database to convert.
+            doip_addressing: Optional DoIP addressing configuration.
+            fbs_bytes: Pre-built FlatBuffers payload, or None to convert ``db``.
+
+        Returns:
+        -------
+            Serialized MDDFile message.
+
         """
         # Convert to FlatBuffers
-        converter = IRToFlatBuffersConverter()
-        fbs_bytes = converter.convert(db, doip_addressing=doip_addressing)
+        if fbs_bytes is None:
+            converter = IRToFlatBuffersConverter()
+            fbs_bytes = converter.convert(db, doip_addressing=doip_addressing)
 
         # Optionally compress
         data = fbs_bytes
@@ -108,8 +185,7 @@ class MDDWriter:
         # Create Protobuf container
         mdd = self._create_mdd_file(db, data, uncompressed_size)
 
-        # Return magic header + protobuf data
-        return FILE_MAGIC + bytes(mdd.SerializeToString())
+        return bytes(mdd.SerializeToString())
 
     def _create_mdd_file(
         self,
@@ -196,9 +272,7 @@ class MDDWriter:
                 ) from None
 
         elif self._compression == "gzip":
-            import gzip
-
-            compressed = gzip.compress(data)
+            compressed = _gzip.compress(data, compresslevel=_GZIP_LEVEL)
             return compressed, original_size
 
         else:
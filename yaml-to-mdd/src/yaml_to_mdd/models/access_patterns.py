@@ -6,11 +6,11 @@ from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from yaml_to_mdd.models.common import HexInt8
+from yaml_to_mdd.models.common import HexInt8, InternedStr
 
 # Special values for "any" session access or "none" for security/auth
-SessionsValue = Literal["any"] | list[str]
-SecurityValue = Literal["none"] | list[str]
+SessionsValue = Literal["any"] | list[InternedStr]
+SecurityValue = Literal["none"] | list[InternedStr]
 AuthenticationValue = Literal["none"] | list[str]
 
 
@@ -123,6 +123,18 @@ class AccessPattern(BaseModel):
             return v
         raise ValueError("authentication must be 'none' or a list of role names")
 
+    @property
+    def sessions_list(self) -> list[str] | None:
+        """Required session names, or None when any session is allowed."""
+        sessions = self.sessions
+        return None if sessions == "any" else sessions
+
+    @property
+    def security_list(self) -> list[str] | None:
+        """Required security level names, or None when no security is needed."""
+        security = self.security
+        return None if security == "none" else security
+
     def requires_session(self, session_name: str) -> bool:
         """Check if this pattern allows the given session."""
         if self.sessions == "any":
@@ -139,4 +151,4 @@ class AccessPattern(BaseModel):
 
 
 # Type alias for the access_patterns section
-AccessPatterns = dict[str, AccessPattern]
+AccessPatterns = dict[InternedStr, AccessPattern]
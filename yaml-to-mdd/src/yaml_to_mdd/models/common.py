@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Annotated, Any
 
 from pydantic import AfterValidator, BeforeValidator, PlainSerializer
@@ -152,6 +153,11 @@ HexInt64 = Annotated[
 ]
 
 
+# Name string interned on load, so validator set lookups of type, session,
+# security and access pattern names can match by identity
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
 # Optional hex variants (for fields that can be None)
 HexInt8Optional = HexInt8 | None
 HexInt16Optional = HexInt16 | None
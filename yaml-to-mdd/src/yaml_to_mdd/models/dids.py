@@ -7,6 +7,7 @@ from typing import Annotated, Any
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_core import core_schema
 
+from yaml_to_mdd.models.common import InternedStr
 from yaml_to_mdd.models.types import TypeDefinition
 
 # Forward reference for AudienceSet to avoid circular imports
@@ -144,7 +145,7 @@ class DIDDefinition(BaseModel):
 
     # Type can be a reference (string) or inline definition
     type: Annotated[
-        str | TypeDefinition,
+        InternedStr | TypeDefinition,
         Field(
             description="Type reference or inline type definition",
         ),
@@ -197,7 +198,7 @@ class DIDDefinition(BaseModel):
 
     # Legacy/deprecated fields (kept for backward compatibility)
     access_pattern: Annotated[
-        str | None,
+        InternedStr | None,
         Field(
             default=None,
             description="Deprecated: use 'access' instead",
@@ -10,6 +10,12 @@ from pydantic import ValidationError
 
 from yaml_to_mdd.models.root import DiagnosticDescription
 
+# Prefer libyaml's C parser; it accepts the same documents as the pure-Python SafeLoader
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class LoaderError(Exception):
     """Error during YAML/JSON file loading."""
@@ -58,7 +64,7 @@ def load_yaml_file(path: Path) -> dict[str, Any]:
 
     try:
         with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise LoaderError(f"YAML parsing error: {e}", path) from e
     except OSError as e:
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from yaml_to_mdd.models.common import InternedStr
 from yaml_to_mdd.models.types import TypeDefinition
 
 if TYPE_CHECKING:
@@ -44,7 +45,7 @@ class RoutineParameter(BaseModel):
     ]
 
     type: Annotated[
-        str | TypeDefinition,
+        InternedStr | TypeDefinition,
         Field(
             description="Type reference (built-in or custom type name) or inline type definition",
         ),
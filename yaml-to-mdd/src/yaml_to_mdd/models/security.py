@@ -6,7 +6,7 @@ from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from yaml_to_mdd.models.common import HexInt8
+from yaml_to_mdd.models.common import HexInt8, InternedStr
 
 
 class SecurityLevel(BaseModel):
@@ -161,4 +161,4 @@ class SecurityLevel(BaseModel):
 
 
 # Type alias for the security section
-Security = dict[str, SecurityLevel]
+Security = dict[InternedStr, SecurityLevel]
@@ -6,7 +6,7 @@ from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from yaml_to_mdd.models.common import HexInt8
+from yaml_to_mdd.models.common import HexInt8, InternedStr
 
 
 class SessionTiming(BaseModel):
@@ -101,4 +101,4 @@ class Session(BaseModel):
 
 # Type alias for the sessions dictionary
 # Key is session name (e.g., "default", "extended"), value is Session definition
-Sessions = dict[str, Session]
+Sessions = dict[InternedStr, Session]
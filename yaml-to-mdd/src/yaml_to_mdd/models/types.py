@@ -7,6 +7,8 @@ from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from yaml_to_mdd.models.common import InternedStr
+
 
 class BaseType(str, Enum):
     """Base data types for type definitions.
@@ -631,4 +633,4 @@ class TypeDefinition(BaseModel):
 
 
 # Type alias for the types dictionary
-Types = dict[str, TypeDefinition]
+Types = dict[InternedStr, TypeDefinition]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Optionally compile hot pure-Python modules to C extensions with mypyc.
+
+The compiled extension modules are placed next to their ``.py`` sources and
+take precedence on import. Removing them (``--clean``) falls back to the
+pure-Python implementation, so compilation is never required.
+
+Usage:
+    poetry run compile-mypyc
+    poetry run compile-mypyc --clean
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules compiled by mypyc, relative to the src/ directory
+MYPYC_MODULES = [
+    "yaml_to_mdd/validation/consistency_validators.py",
+    "yaml_to_mdd/validation/reference_validators.py",
+    "yaml_to_mdd/transform/type_converter.py",
+]
+
+
+def find_mypyc() -> Path | None:
+    """Find the mypyc compiler (shipped with mypy)."""
+    mypyc = shutil.which("mypyc")
+    if mypyc:
+        return Path(mypyc)
+    return None
+
+
+def clean(src_root: Path) -> int:
+    """Remove compiled extension modules and build artifacts."""
+    removed = 0
+    for module in MYPYC_MODULES:
+        module_path = src_root / module
+        for ext in module_path.parent.glob(f"{module_path.stem}.*.so"):
+            ext.unlink()
+            removed += 1
+    for runtime in src_root.glob("*__mypyc.*.so"):
+        runtime.unlink()
+        removed += 1
+    shutil.rmtree(src_root / "build", ignore_errors=True)
+
+    print(f"Removed {removed} compiled module(s); pure-Python sources will be used.")
+    return 0
+
+
+def main() -> int:
+    """Compile the hot modules with mypyc."""
+    # Determine paths
+    script_dir = Path(__file__).parent
+    src_root = script_dir.parent.parent
+
+    if "--clean" in sys.argv[1:]:
+        return clean(src_root)
+
+    # Find mypyc
+    mypyc = find_mypyc()
+    if not mypyc:
+        print("Error: mypyc not found. Install the dev dependencies (mypy ships mypyc).")
+        print("  poetry install --with dev")
+        return 1
+
+    print(f"Using mypyc: {mypyc}")
+    print(f"Compiling {len(MYPYC_MODULES)} module(s)...")
+    result = subprocess.run(
+        [str(mypyc), *MYPYC_MODULES],
+        cwd=src_root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        print(f"Error: mypyc failed with exit code {result.returncode}")
+        print(result.stdout)
+        print(result.stderr)
+        return 1
+
+    print("\nCompilation complete!")
+    for module in MYPYC_MODULES:
+        print(f"  {module}")
+    print("Run 'poetry run compile-mypyc --clean' to return to the pure-Python modules.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -73,6 +73,10 @@ class YamlToIRTransformer:
             IRDatabase ready for FlatBuffers serialization.
 
         """
+        # Reset state for fresh transformation
+        self._type_cache.clear()
+        self._variant_specific_services.clear()
+
         # Create database with metadata
         db = IRDatabase(
             ecu_name=doc.ecu.id,
@@ -32,6 +32,13 @@ BASE_TYPE_TO_IR: dict[BaseType, tuple[IRDataType, int]] = {
 }
 
 
+def _parse_enum_key(internal: int | str) -> int:
+    """Parse an enum key that may be an int, a decimal string or a "0x"-prefixed hex string."""
+    if isinstance(internal, str):
+        return int(internal, 16) if internal.startswith("0x") else int(internal)
+    return internal
+
+
 def create_compu_method_for_type(type_def: TypeDefinition) -> IRCompuMethod | None:
     """Create computation method from type definition.
 
@@ -46,24 +53,17 @@ def create_compu_method_for_type(type_def: TypeDefinition) -> IRCompuMethod | No
     """
     # Check for enum mapping
     if type_def.enum is not None:
-        scales = []
-        for internal, text in type_def.enum.items():
-            # Handle both int and str keys
-            if isinstance(internal, str):
-                internal_val = int(internal, 16) if internal.startswith("0x") else int(internal)
-            else:
-                internal_val = internal
-
-            scales.append(
-                IRCompuScale(
-                    internal_value=internal_val,
-                    text_value=str(text),
-                )
+        scales = tuple(
+            IRCompuScale(
+                internal_value=_parse_enum_key(internal),
+                text_value=str(text),
             )
+            for internal, text in type_def.enum.items()
+        )
 
         return IRCompuMethod(
             category=IRCompuCategory.TEXT_TABLE,
-            scales=tuple(scales),
+            scales=scales,
         )
 
     # Check for linear scaling
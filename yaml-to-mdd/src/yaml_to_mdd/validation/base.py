@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from yaml_to_mdd.validation.errors import ValidationResult
@@ -10,6 +12,107 @@ from yaml_to_mdd.validation.errors import ValidationResult
 if TYPE_CHECKING:
     from yaml_to_mdd.models.root import DiagnosticDescription
 
+# Built-in types that are always valid type references
+BUILTIN_TYPES = frozenset(
+    {
+        "u8",
+        "u16",
+        "u24",
+        "u32",
+        "u64",
+        "i8",
+        "i16",
+        "i32",
+        "i64",
+        "f32",
+        "f64",
+        "bool",
+        "string",
+        "bytes",
+        "ascii",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaIndex:
+    """Names defined by a document, built once and shared by validators."""
+
+    defined_types: frozenset[str]
+    """Names of the types in the 'types' section."""
+
+    defined_sessions: frozenset[str]
+    """Names of the sessions in the 'sessions' section."""
+
+    defined_security: frozenset[str]
+    """Names of the levels in the 'security' section."""
+
+    defined_patterns: frozenset[str]
+    """Names of the patterns in the 'access_patterns' section."""
+
+    did_refs: tuple[tuple[int, str | None, str | None], ...]
+    """(address, named type, access pattern) of each DID; None if inline or absent."""
+
+    routine_param_refs: tuple[tuple[int, str, str, str, str], ...]
+    """(routine ID, operation, direction, parameter name, type) of each named-type parameter."""
+
+    @classmethod
+    def from_doc(cls, doc: DiagnosticDescription) -> SchemaIndex:
+        """Build the index for a document.
+
+        Args:
+        ----
+            doc: The diagnostic description to index.
+
+        Returns:
+        -------
+            SchemaIndex with all defined names and references.
+
+        """
+        return cls(
+            defined_types=frozenset(doc.types or ()),
+            defined_sessions=frozenset(doc.sessions or ()),
+            defined_security=frozenset(doc.security or ()),
+            defined_patterns=frozenset(doc.access_patterns or ()),
+            did_refs=tuple(
+                (
+                    did_addr,
+                    did_def.type if isinstance(did_def.type, str) else None,
+                    did_def.access_pattern,
+                )
+                for did_addr, did_def in (doc.dids or {}).items()
+            ),
+            routine_param_refs=tuple(_iter_routine_param_refs(doc)),
+        )
+
+
+def _iter_routine_param_refs(
+    doc: DiagnosticDescription,
+) -> Iterator[tuple[int, str, str, str, str]]:
+    """Yield the routine parameters that reference a type by name."""
+    for routine_id, routine_def in (doc.routines or {}).items():
+        params = routine_def.parameters
+        if params is None:
+            continue
+        try:
+            sections = (
+                ("start", "request", params.start_request),  # type: ignore[attr-defined]
+                ("start", "response", params.start_response),  # type: ignore[attr-defined]
+                ("result", "response", params.result_response),  # type: ignore[attr-defined]
+            )
+        except AttributeError:
+            # RoutineParameters declares start/stop/result instead of these
+            # fields, so this check does not run yet
+            continue
+        for op_name, io_name, section in sections:
+            for param in section or ():
+                # Inline type definitions are not references
+                if isinstance(param.type, str):
+                    yield routine_id, op_name, io_name, param.name, param.type
+
+
+ValidateFn = Callable[["DiagnosticDescription", ValidationResult, SchemaIndex], None]
+
 
 class BaseValidator(ABC):
     """Base class for validators."""
@@ -30,19 +133,90 @@ class BaseValidator(ABC):
         """
         ...
 
+    def validate_indexed(
+        self,
+        doc: DiagnosticDescription,
+        result: ValidationResult,
+        index: SchemaIndex,
+    ) -> None:
+        """Validate the document using an index shared across validators.
 
-class CompositeValidator(BaseValidator):
+        :class:`CompositeValidator` calls this instead of :meth:`validate`.
+        Validators that read the index override it; by default the index is
+        ignored and :meth:`validate` is called.
+
+        Args:
+        ----
+            doc: The diagnostic description to validate.
+            result: The result object to add issues to.
+            index: Pre-built index of the names defined by ``doc``.
+
+        """
+        self.validate(doc, result)
+
+
+class IndexedValidator(BaseValidator):
+    """Base class for validators that read a :class:`SchemaIndex`.
+
+    Subclasses implement :meth:`validate_indexed`; calling :meth:`validate`
+    directly builds the index for that one run.
+    """
+
+    def validate(
+        self,
+        doc: DiagnosticDescription,
+        result: ValidationResult,
+    ) -> None:
+        """Validate the document and add issues to result.
+
+        Args:
+        ----
+            doc: The diagnostic description to validate.
+            result: The result object to add issues to.
+
+        """
+        self.validate_indexed(doc, result, SchemaIndex.from_doc(doc))
+
+    @abstractmethod
+    def validate_indexed(
+        self,
+        doc: DiagnosticDescription,
+        result: ValidationResult,
+        index: SchemaIndex,
+    ) -> None:
+        """Validate the document using an index shared across validators.
+
+        Args:
+        ----
+            doc: The diagnostic description to validate.
+            result: The result object to add issues to.
+            index: Pre-built index of the names defined by ``doc``.
+
+        """
+        ...
+
+
+class CompositeValidator(IndexedValidator):
     """Combines multiple validators."""
 
-    def __init__(self, validators: list[BaseValidator] | None = None) -> None:
+    def __init__(self, validators: Iterable[BaseValidator] | None = None) -> None:
         """Initialize with optional list of validators.
 
         Args:
         ----
-            validators: List of validators to combine.
+            validators: Validators to combine, in run order.
 
         """
-        self.validators = validators or []
+        self._validators: tuple[BaseValidator, ...] = tuple(validators or ())
+        # Bound once here and in add(), so the run loop does no attribute lookups
+        self._validate_fns: tuple[ValidateFn, ...] = tuple(
+            v.validate_indexed for v in self._validators
+        )
+
+    @property
+    def validators(self) -> tuple[BaseValidator, ...]:
+        """The combined validators, in run order; use :meth:`add` to extend."""
+        return self._validators
 
     def add(self, validator: BaseValidator) -> None:
         """Add a validator.
@@ -52,20 +226,23 @@ class CompositeValidator(BaseValidator):
             validator: Validator to add.
 
         """
-        self.validators.append(validator)
+        self._validators += (validator,)
+        self._validate_fns += (validator.validate_indexed,)
 
-    def validate(
+    def validate_indexed(
         self,
         doc: DiagnosticDescription,
         result: ValidationResult,
+        index: SchemaIndex,
     ) -> None:
-        """Run all validators.
+        """Run all validators, sharing one index between them.
 
         Args:
         ----
             doc: The diagnostic description to validate.
             result: The result object to add issues to.
+            index: Pre-built index of the names defined by ``doc``.
 
         """
-        for validator in self.validators:
-            validator.validate(doc, result)
+        for validate_fn in self._validate_fns:
+            validate_fn(doc, result, index)
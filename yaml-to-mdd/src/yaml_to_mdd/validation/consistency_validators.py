@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from yaml_to_mdd.validation.base import BaseValidator
-from yaml_to_mdd.validation.errors import ErrorCodes, ValidationResult
+from bisect import bisect_right
+from collections.abc import Set
+from typing import TYPE_CHECKING, ClassVar
+
+from yaml_to_mdd.validation.base import BaseValidator, SchemaIndex
+from yaml_to_mdd.validation.errors import (
+    ErrorCodes,
+    ValidationIssue,
+    ValidationLocation,
+    ValidationResult,
+    ValidationSeverity,
+)
 
 if TYPE_CHECKING:
     from yaml_to_mdd.models.root import DiagnosticDescription
 
+# Valid SAE J2012 DTC prefixes: Powertrain, Body, Chassis, Network
+_SAE_PREFIXES = frozenset({"P", "B", "C", "U"})
+
 
 class UniqueSessionIdValidator(BaseValidator):
     """Validates that session IDs are unique."""
@@ -24,22 +35,27 @@ class UniqueSessionIdValidator(BaseValidator):
             return
 
         seen_ids: dict[int, str] = {}
+        duplicates: list[tuple[str, int, str]] = []
 
         for session_name, session_def in doc.sessions.items():
-            session_id = session_def.id
+            first_name = seen_ids.setdefault(session_def.id, session_name)
+            if first_name != session_name:
+                duplicates.append((session_name, session_def.id, first_name))
 
-            if session_id in seen_ids:
-                result.add_error(
+        if duplicates:
+            result.extend(
+                ValidationIssue(
                     code=ErrorCodes.E100_DUPLICATE_ID,
                     message=(
                         f"Session '{session_name}' has duplicate ID {session_id:#04x}, "
-                        f"already used by '{seen_ids[session_id]}'"
+                        f"already used by '{first_name}'"
                     ),
-                    path=f"sessions.{session_name}.id",
+                    severity=ValidationSeverity.ERROR,
+                    location=ValidationLocation(path=f"sessions.{session_name}.id"),
                     suggestion="Each session must have a unique ID",
                 )
-            else:
-                seen_ids[session_id] = session_name
+                for session_name, session_id, first_name in duplicates
+            )
 
 
 class UniqueSecurityLevelValidator(BaseValidator):
@@ -78,40 +94,38 @@ class UniqueSecurityLevelValidator(BaseValidator):
                     suggestion="Usually key_send = seed_request + 1",
                 )
 
-            # Check for duplicate seed_request values
-            if seed_request in seen_seed_requests:
+            # Check for duplicate seed_request values (one dict lookup per level)
+            first_seed_level = seen_seed_requests.setdefault(seed_request, level_name)
+            if first_seed_level != level_name:
                 result.add_error(
                     code=ErrorCodes.E100_DUPLICATE_ID,
                     message=(
                         f"Security level '{level_name}' has duplicate seed_request "
                         f"{seed_request:#04x}, already used by "
-                        f"'{seen_seed_requests[seed_request]}'"
+                        f"'{first_seed_level}'"
                     ),
                     path=f"security.{level_name}.seed_request",
                 )
-            else:
-                seen_seed_requests[seed_request] = level_name
 
             # Check for duplicate key_send values
-            if key_send in seen_key_sends:
+            first_key_level = seen_key_sends.setdefault(key_send, level_name)
+            if first_key_level != level_name:
                 result.add_error(
                     code=ErrorCodes.E100_DUPLICATE_ID,
                     message=(
                         f"Security level '{level_name}' has duplicate key_send "
                         f"{key_send:#04x}, already used by "
-                        f"'{seen_key_sends[key_send]}'"
+                        f"'{first_key_level}'"
                     ),
                     path=f"security.{level_name}.key_send",
                 )
-            else:
-                seen_key_sends[key_send] = level_name
 
 
 class DIDRangeValidator(BaseValidator):
     """Validates that DID addresses are in valid UDS ranges."""
 
     # Standard DID ranges per ISO 14229
-    DID_RANGES = [
+    DID_RANGES: ClassVar[list[tuple[int, int, str]]] = [
         (0x0000, 0x00FF, "ISO Reserved"),
         (0x0100, 0x01FF, "Vehicle Manufacturer Specific"),
         (0x0200, 0x02FF, "Network Configuration"),
@@ -143,16 +157,40 @@ class DIDRangeValidator(BaseValidator):
             return
 
         for did_addr, _did_def in doc.dids.items():
-            if not 0x0000 <= did_addr <= 0xFFFF:
+            # Non-zero for anything above 0xFFFF, and -1 for negative values
+            if did_addr >> 16:
+                addr_hex = f"{did_addr:#06x}"
                 result.add_error(
                     code=ErrorCodes.E201_INVALID_DID_ADDRESS,
-                    message=(
-                        f"DID address {did_addr:#06x} is out of valid range " "(0x0000-0xFFFF)"
-                    ),
-                    path=f"dids.{did_addr:#06x}",
+                    message=f"DID address {addr_hex} is out of valid range (0x0000-0xFFFF)",
+                    path=f"dids.{addr_hex}",
                 )
 
 
+# Sorted DID range starts for bisect lookup, and matching (end, label) pairs
+_DID_RANGE_STARTS = tuple(start for start, _end, _label in DIDRangeValidator.DID_RANGES)
+_DID_RANGE_ENDS_LABELS = tuple((end, label) for _start, end, label in DIDRangeValidator.DID_RANGES)
+
+
+def _classify_did(did_addr: int) -> str | None:
+    """Get the ISO 14229 category of a DID address.
+
+    Args:
+    ----
+        did_addr: The DID address.
+
+    Returns:
+    -------
+        Category label, or None if the address is in no known range.
+
+    """
+    index = bisect_right(_DID_RANGE_STARTS, did_addr) - 1
+    if index < 0:
+        return None
+    end, label = _DID_RANGE_ENDS_LABELS[index]
+    return label if did_addr <= end else None
+
+
 class DTCFormatValidator(BaseValidator):
     """Validates DTC format follows SAE J2012 conventions."""
 
@@ -170,7 +208,7 @@ class DTCFormatValidator(BaseValidator):
             sae_code = dtc_def.sae
             if sae_code and len(sae_code) == 5:
                 prefix = sae_code[0].upper()
-                if prefix not in ("P", "B", "C", "U"):
+                if prefix not in _SAE_PREFIXES:
                     result.add_error(
                         code=ErrorCodes.E302_INVALID_DTC_FORMAT,
                         message=(
@@ -209,13 +247,12 @@ class RoutineIdRangeValidator(BaseValidator):
             return
 
         for routine_id, _routine_def in doc.routines.items():
-            if not 0x0000 <= routine_id <= 0xFFFF:
+            if routine_id >> 16:
+                id_hex = f"{routine_id:#06x}"
                 result.add_error(
                     code=ErrorCodes.E200_VALUE_OUT_OF_RANGE,
-                    message=(
-                        f"Routine ID {routine_id:#06x} is out of valid range " "(0x0000-0xFFFF)"
-                    ),
-                    path=f"routines.{routine_id:#06x}",
+                    message=f"Routine ID {id_hex} is out of valid range (0x0000-0xFFFF)",
+                    path=f"routines.{id_hex}",
                 )
 
 
@@ -228,44 +265,42 @@ class UnusedDefinitionsValidator(BaseValidator):
         result: ValidationResult,
     ) -> None:
         """Check for unused types, sessions, security levels."""
-        self._check_unused_types(doc, result)
+        self._check_unused_types(doc, result, None)
+        self._check_unused_sessions(doc, result)
+
+    def validate_indexed(
+        self,
+        doc: DiagnosticDescription,
+        result: ValidationResult,
+        index: SchemaIndex,
+    ) -> None:
+        """Check for unused definitions, reusing the shared index."""
+        self._check_unused_types(doc, result, index)
         self._check_unused_sessions(doc, result)
 
     def _check_unused_types(
         self,
         doc: DiagnosticDescription,
         result: ValidationResult,
+        index: SchemaIndex | None,
     ) -> None:
         """Check for unused type definitions."""
         if not doc.types:
             return
 
-        used_types: set[str] = set()
-
-        # Collect types used in DIDs
-        if doc.dids:
-            for _did_addr, did_def in doc.dids.items():
-                if isinstance(did_def.type, str):
-                    used_types.add(did_def.type)
-
-        # Collect types used in routines
-        if doc.routines:
-            for _routine_id, routine_def in doc.routines.items():
-                params = getattr(routine_def, "parameters", None)
-                if params:
-                    for section in [
-                        "start_request",
-                        "start_response",
-                        "result_response",
-                    ]:
-                        param_list = getattr(params, section, None)
-                        if param_list:
-                            for param in param_list:
-                                used_types.add(param.type)
-
-        # Find unused types
+        if not (doc.dids or doc.routines):
+            # Nothing can reference a type, so every definition is unused
+            unused_types: Set[str] = doc.types.keys()
+        else:
+            # Set difference runs in C; warnings are still emitted in definition order
+            if index is None:
+                index = SchemaIndex.from_doc(doc)
+            unused_types = doc.types.keys() - self._collect_used_types(index)
+            if not unused_types:
+                return
+
         for type_name in doc.types:
-            if type_name not in used_types:
+            if type_name in unused_types:
                 result.add_warning(
                     code=ErrorCodes.W001_UNUSED_TYPE,
                     message=f"Type '{type_name}' is defined but never used",
@@ -273,6 +308,15 @@ class UnusedDefinitionsValidator(BaseValidator):
                     suggestion="Remove unused type or reference it in DIDs/routines",
                 )
 
+    @staticmethod
+    def _collect_used_types(index: SchemaIndex) -> set[str]:
+        """Collect named types referenced by DIDs and routine parameters."""
+        used_types = {
+            did_type for _addr, did_type, _pattern in index.did_refs if did_type is not None
+        }
+        used_types.update(ref[4] for ref in index.routine_param_refs)
+        return used_types
+
     def _check_unused_sessions(
         self,
         doc: DiagnosticDescription,
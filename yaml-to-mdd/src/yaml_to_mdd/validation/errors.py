@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -15,7 +17,7 @@ class ValidationSeverity(Enum):
     INFO = "info"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationLocation:
     """Location in the YAML where an issue was found."""
 
@@ -28,6 +30,10 @@ class ValidationLocation:
     column: int | None = None
     """Column number in the source file (if available)."""
 
+    def __post_init__(self) -> None:
+        """Intern the path so issues citing the same location share one string."""
+        object.__setattr__(self, "path", sys.intern(self.path))
+
     def __str__(self) -> str:
         """Format location as string."""
         if self.line is not None:
@@ -37,7 +43,7 @@ class ValidationLocation:
         return self.path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     """A single validation issue."""
 
@@ -69,30 +75,82 @@ class ValidationIssue:
         return " ".join(parts)
 
 
-@dataclass
+@dataclass(init=False, slots=True)
 class ValidationResult:
-    """Result of validation containing all issues."""
+    """Result of validation containing all issues.
+
+    ``issues`` is read-only; issues are added through :meth:`add`,
+    :meth:`extend` or :meth:`merge`, which keep the per-severity lists in sync.
+    """
+
+    _issues: list[ValidationIssue]
+    _errors: list[ValidationIssue] = field(repr=False, compare=False)
+    _warnings: list[ValidationIssue] = field(repr=False, compare=False)
+
+    def __init__(self, issues: Iterable[ValidationIssue] = ()) -> None:
+        """Initialize with optional pre-built issues.
+
+        Args:
+        ----
+            issues: Issues to start with, in order.
+
+        """
+        self._issues = []
+        self._errors = []
+        self._warnings = []
+        self.extend(issues)
 
-    issues: list[ValidationIssue] = field(default_factory=list)
+    def _bucket(self, issues: Iterable[ValidationIssue]) -> None:
+        """Append newly added issues to their severity list."""
+        for issue in issues:
+            if issue.severity is ValidationSeverity.ERROR:
+                self._errors.append(issue)
+            elif issue.severity is ValidationSeverity.WARNING:
+                self._warnings.append(issue)
+
+    @property
+    def issues(self) -> tuple[ValidationIssue, ...]:
+        """Get all issues in the order they were added."""
+        return tuple(self._issues)
 
     @property
     def errors(self) -> list[ValidationIssue]:
         """Get only error-level issues."""
-        return [i for i in self.issues if i.severity == ValidationSeverity.ERROR]
+        return self._errors.copy()
 
     @property
     def warnings(self) -> list[ValidationIssue]:
         """Get only warning-level issues."""
-        return [i for i in self.issues if i.severity == ValidationSeverity.WARNING]
+        return self._warnings.copy()
+
+    @property
+    def error_count(self) -> int:
+        """Get the number of error-level issues without scanning."""
+        return len(self._errors)
+
+    @property
+    def warning_count(self) -> int:
+        """Get the number of warning-level issues without scanning."""
+        return len(self._warnings)
 
     @property
     def is_valid(self) -> bool:
         """Check if there are no errors (warnings are OK)."""
-        return len(self.errors) == 0
+        return not self._errors
 
     def add(self, issue: ValidationIssue) -> None:
         """Add an issue to the result."""
-        self.issues.append(issue)
+        self._issues.append(issue)
+        if issue.severity is ValidationSeverity.ERROR:
+            self._errors.append(issue)
+        elif issue.severity is ValidationSeverity.WARNING:
+            self._warnings.append(issue)
+
+    def extend(self, issues: Iterable[ValidationIssue]) -> None:
+        """Add several pre-built issues at once."""
+        start = len(self._issues)
+        self._issues.extend(issues)
+        self._bucket(self._issues[start:])
 
     def add_error(
         self,
@@ -136,7 +194,9 @@ class ValidationResult:
 
     def merge(self, other: ValidationResult) -> None:
         """Merge another result into this one."""
-        self.issues.extend(other.issues)
+        self._issues.extend(other._issues)
+        self._errors.extend(other._errors)
+        self._warnings.extend(other._warnings)
 
 
 class ErrorCodes:
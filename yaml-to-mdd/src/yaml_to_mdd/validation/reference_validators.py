@@ -2,251 +2,265 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Iterable, Set
+from typing import TYPE_CHECKING, ClassVar
 
-from yaml_to_mdd.validation.base import BaseValidator
+from yaml_to_mdd.validation.base import BUILTIN_TYPES, IndexedValidator, SchemaIndex
 from yaml_to_mdd.validation.errors import ErrorCodes, ValidationResult
 
 if TYPE_CHECKING:
     from yaml_to_mdd.models.root import DiagnosticDescription
 
+# Sentinels that are valid inside session/security lists without a definition
+_ANY_SESSION = frozenset({"any"})
+_NO_SECURITY = frozenset({"none"})
 
-class TypeReferenceValidator(BaseValidator):
+
+class TypeReferenceValidator(IndexedValidator):
     """Validates that type references point to defined types."""
 
     # Built-in types that are always valid
-    BUILTIN_TYPES = frozenset(
-        {
-            "u8",
-            "u16",
-            "u24",
-            "u32",
-            "u64",
-            "i8",
-            "i16",
-            "i32",
-            "i64",
-            "f32",
-            "f64",
-            "bool",
-            "string",
-            "bytes",
-            "ascii",
-        }
-    )
+    BUILTIN_TYPES: ClassVar[frozenset[str]] = BUILTIN_TYPES
 
-    def validate(
+    def validate_indexed(
         self,
         doc: DiagnosticDescription,
         result: ValidationResult,
+        index: SchemaIndex,
     ) -> None:
         """Validate type references in DIDs and routines."""
-        defined_types: set[str] = set()
-
-        if doc.types:
-            defined_types = set(doc.types.keys())
+        if not doc.dids and not doc.routines:
+            return
 
-        # All valid types = defined + builtins
-        valid_types = defined_types | self.BUILTIN_TYPES
+        defined_types = index.defined_types
+        # Shared by every E001 issue of this run
+        available_types = tuple(sorted(defined_types))
 
-        # Check DID type references
-        if doc.dids:
-            for did_addr, did_def in doc.dids.items():
-                # Check if it's a reference to a named type that doesn't exist
-                if isinstance(did_def.type, str) and did_def.type not in valid_types:
-                    result.add_error(
-                        code=ErrorCodes.E001_UNDEFINED_TYPE,
-                        message=(
-                            f"DID {did_addr:#06x} references undefined type " f"'{did_def.type}'"
-                        ),
-                        path=f"dids.{did_addr:#06x}.type",
-                        suggestion=f"Define '{did_def.type}' in the 'types' section",
-                        referenced_type=did_def.type,
-                        available_types=list(defined_types),
-                    )
+        # Check DID type references (inline type definitions have no name)
+        for did_addr, did_type, _access_pattern in index.did_refs:
+            if did_type is not None and _is_undefined_type(did_type, defined_types):
+                _report_undefined_did_type(did_addr, did_type, available_types, result)
 
         # Check routine parameter type references
-        if doc.routines:
-            for routine_id, routine_def in doc.routines.items():
-                self._validate_routine_params(routine_id, routine_def, valid_types, result)
+        _validate_routine_params(index.routine_param_refs, defined_types, result)
 
-    def _validate_routine_params(
+
+class SessionReferenceValidator(IndexedValidator):
+    """Validates that session references point to defined sessions."""
+
+    def validate_indexed(
         self,
-        routine_id: int,
-        routine_def: object,
-        valid_types: set[str],
+        doc: DiagnosticDescription,
         result: ValidationResult,
+        index: SchemaIndex,
     ) -> None:
-        """Validate type references in routine parameters."""
-        params = getattr(routine_def, "parameters", None)
-        if not params:
+        """Validate session references in access patterns."""
+        if not doc.sessions or not doc.access_patterns:
             return
 
-        # Check start parameters
-        start_request = getattr(params, "start_request", None)
-        if start_request:
-            for param in start_request:
-                if param.type not in valid_types:
-                    result.add_error(
-                        code=ErrorCodes.E001_UNDEFINED_TYPE,
-                        message=(
-                            f"Routine {routine_id:#06x} start request parameter "
-                            f"'{param.name}' references undefined type '{param.type}'"
-                        ),
-                        path=f"routines.{routine_id:#06x}.parameters.start_request.{param.name}.type",
-                        suggestion=f"Define '{param.type}' in the 'types' section",
-                    )
+        defined_sessions = index.defined_sessions
+        # "any" is a special value meaning all sessions
+        valid_sessions = defined_sessions | _ANY_SESSION
+        # Shared by every E002 issue of this run
+        available_sessions = tuple(sorted(defined_sessions))
 
-        start_response = getattr(params, "start_response", None)
-        if start_response:
-            for param in start_response:
-                if param.type not in valid_types:
-                    result.add_error(
-                        code=ErrorCodes.E001_UNDEFINED_TYPE,
-                        message=(
-                            f"Routine {routine_id:#06x} start response parameter "
-                            f"'{param.name}' references undefined type '{param.type}'"
-                        ),
-                        path=f"routines.{routine_id:#06x}.parameters.start_response.{param.name}.type",
-                        suggestion=f"Define '{param.type}' in the 'types' section",
-                    )
+        # Check access pattern session references
+        for pattern_name, pattern in doc.access_patterns.items():
+            sessions = pattern.sessions_list
+            if sessions is None:
+                continue
 
-        result_response = getattr(params, "result_response", None)
-        if result_response:
-            for param in result_response:
-                if param.type not in valid_types:
+            for session in sessions:
+                if session not in valid_sessions:
                     result.add_error(
-                        code=ErrorCodes.E001_UNDEFINED_TYPE,
+                        code=ErrorCodes.E002_UNDEFINED_SESSION,
                         message=(
-                            f"Routine {routine_id:#06x} result response parameter "
-                            f"'{param.name}' references undefined type '{param.type}'"
+                            f"Access pattern '{pattern_name}' references "
+                            f"undefined session '{session}'"
                         ),
-                        path=f"routines.{routine_id:#06x}.parameters.result_response.{param.name}.type",
-                        suggestion=f"Define '{param.type}' in the 'types' section",
+                        path=f"access_patterns.{pattern_name}.sessions",
+                        suggestion=f"Define '{session}' in the 'sessions' section",
+                        referenced_session=session,
+                        available_sessions=available_sessions,
                     )
 
 
-class SessionReferenceValidator(BaseValidator):
-    """Validates that session references point to defined sessions."""
+class SecurityReferenceValidator(IndexedValidator):
+    """Validates that security level references are valid."""
 
-    def validate(
+    def validate_indexed(
         self,
         doc: DiagnosticDescription,
         result: ValidationResult,
+        index: SchemaIndex,
     ) -> None:
-        """Validate session references in access patterns."""
-        if not doc.sessions:
+        """Validate security references in access patterns."""
+        if not doc.access_patterns:
             return
 
-        defined_sessions = set(doc.sessions.keys())
-        defined_sessions.add("any")  # Special value meaning all sessions
+        # "none" is always valid
+        valid_security = index.defined_security | _NO_SECURITY
 
-        # Check access pattern session references
-        if doc.access_patterns:
-            for pattern_name, pattern in doc.access_patterns.items():
-                sessions = pattern.sessions
-
-                if sessions == "any":
-                    continue
-
-                if isinstance(sessions, list):
-                    for session in sessions:
-                        if session not in defined_sessions:
-                            result.add_error(
-                                code=ErrorCodes.E002_UNDEFINED_SESSION,
-                                message=(
-                                    f"Access pattern '{pattern_name}' references "
-                                    f"undefined session '{session}'"
-                                ),
-                                path=f"access_patterns.{pattern_name}.sessions",
-                                suggestion=f"Define '{session}' in the 'sessions' section",
-                                referenced_session=session,
-                                available_sessions=list(defined_sessions),
-                            )
-
-
-class SecurityReferenceValidator(BaseValidator):
-    """Validates that security level references are valid."""
+        # Check access pattern security references
+        for pattern_name, pattern in doc.access_patterns.items():
+            security = pattern.security_list
+            if security is None:
+                continue
 
-    def validate(
+            for sec_level in security:
+                if sec_level not in valid_security:
+                    result.add_error(
+                        code=ErrorCodes.E003_UNDEFINED_SECURITY,
+                        message=(
+                            f"Access pattern '{pattern_name}' references "
+                            f"undefined security level '{sec_level}'"
+                        ),
+                        path=f"access_patterns.{pattern_name}.security",
+                        suggestion=f"Define '{sec_level}' in the 'security' section or use 'none'",
+                    )
+
+
+class AccessPatternReferenceValidator(IndexedValidator):
+    """Validates that access pattern references are valid."""
+
+    def validate_indexed(
         self,
         doc: DiagnosticDescription,
         result: ValidationResult,
+        index: SchemaIndex,
     ) -> None:
-        """Validate security references in access patterns."""
-        defined_security: set[str] = set()
+        """Validate access pattern references in DIDs and routines."""
+        if not doc.dids and not doc.routines:
+            return
 
-        # Collect defined security levels
-        if doc.security:
-            defined_security = set(doc.security.keys())
+        defined_patterns = index.defined_patterns
 
-        defined_security.add("none")  # Always valid
+        # Check DID access pattern references
+        for did_addr, _did_type, access_pattern in index.did_refs:
+            if access_pattern and access_pattern not in defined_patterns:
+                _report_undefined_did_access_pattern(did_addr, access_pattern, result)
 
-        # Check access pattern security references
-        if doc.access_patterns:
-            for pattern_name, pattern in doc.access_patterns.items():
-                security = pattern.security
-
-                if security == "none":
-                    continue
-
-                if isinstance(security, list):
-                    for sec_level in security:
-                        if sec_level not in defined_security:
-                            result.add_error(
-                                code=ErrorCodes.E003_UNDEFINED_SECURITY,
-                                message=(
-                                    f"Access pattern '{pattern_name}' references "
-                                    f"undefined security level '{sec_level}'"
-                                ),
-                                path=f"access_patterns.{pattern_name}.security",
-                                suggestion=(
-                                    f"Define '{sec_level}' in the 'security' section "
-                                    "or use 'none'"
-                                ),
-                            )
-
-
-class AccessPatternReferenceValidator(BaseValidator):
-    """Validates that access pattern references are valid."""
+        # Check routine access pattern references
+        _validate_routine_access_patterns(doc, defined_patterns, result)
 
-    def validate(
+
+class FusedReferenceValidator(IndexedValidator):
+    """Validates type and access pattern references in one pass over DIDs and routines.
+
+    Performs the checks of :class:`TypeReferenceValidator` and
+    :class:`AccessPatternReferenceValidator` with a single walk of each
+    section, reporting the same issues.
+    """
+
+    def validate_indexed(
         self,
         doc: DiagnosticDescription,
         result: ValidationResult,
+        index: SchemaIndex,
     ) -> None:
-        """Validate access pattern references in DIDs and routines."""
-        defined_patterns: set[str] = set()
+        """Validate type and access pattern references in DIDs and routines."""
+        if not doc.dids and not doc.routines:
+            return
 
-        if doc.access_patterns:
-            defined_patterns = set(doc.access_patterns.keys())
+        defined_types = index.defined_types
+        defined_patterns = index.defined_patterns
+        # Shared by every E001 issue of this run
+        available_types = tuple(sorted(defined_types))
+
+        for did_addr, did_type, access_pattern in index.did_refs:
+            if did_type is not None and _is_undefined_type(did_type, defined_types):
+                _report_undefined_did_type(did_addr, did_type, available_types, result)
+
+            if access_pattern and access_pattern not in defined_patterns:
+                _report_undefined_did_access_pattern(did_addr, access_pattern, result)
+
+        _validate_routine_access_patterns(doc, defined_patterns, result)
+        _validate_routine_params(index.routine_param_refs, defined_types, result)
+
+
+def _is_undefined_type(type_name: str, defined_types: Set[str]) -> bool:
+    """Check whether a type name is neither defined nor built in."""
+    # Two lookups instead of building a defined | builtin union set
+    return type_name not in defined_types and type_name not in BUILTIN_TYPES
+
+
+def _report_undefined_did_type(
+    did_addr: int,
+    type_name: str,
+    available_types: tuple[str, ...],
+    result: ValidationResult,
+) -> None:
+    """Report a DID type reference to an undefined type."""
+    addr_hex = f"{did_addr:#06x}"
+    result.add_error(
+        code=ErrorCodes.E001_UNDEFINED_TYPE,
+        message=f"DID {addr_hex} references undefined type '{type_name}'",
+        path=f"dids.{addr_hex}.type",
+        suggestion=f"Define '{type_name}' in the 'types' section",
+        referenced_type=type_name,
+        available_types=available_types,
+    )
 
-        # Check DID access pattern references
-        if doc.dids:
-            for did_addr, did_def in doc.dids.items():
-                access_pattern = getattr(did_def, "access_pattern", None)
-                if access_pattern and access_pattern not in defined_patterns:
-                    result.add_error(
-                        code=ErrorCodes.E004_UNDEFINED_ACCESS_PATTERN,
-                        message=(
-                            f"DID {did_addr:#06x} references undefined access "
-                            f"pattern '{access_pattern}'"
-                        ),
-                        path=f"dids.{did_addr:#06x}.access_pattern",
-                        suggestion=(f"Define '{access_pattern}' in 'access_patterns' section"),
-                    )
 
-        # Check routine access pattern references
-        if doc.routines:
-            for routine_name, routine_def in doc.routines.items():
-                access_pattern = getattr(routine_def, "access_pattern", None)
-                if access_pattern and access_pattern not in defined_patterns:
-                    result.add_error(
-                        code=ErrorCodes.E004_UNDEFINED_ACCESS_PATTERN,
-                        message=(
-                            f"Routine '{routine_name}' references undefined access "
-                            f"pattern '{access_pattern}'"
-                        ),
-                        path=f"routines.{routine_name}.access_pattern",
-                        suggestion=(f"Define '{access_pattern}' in 'access_patterns' section"),
-                    )
+def _report_undefined_did_access_pattern(
+    did_addr: int,
+    access_pattern: str,
+    result: ValidationResult,
+) -> None:
+    """Report a DID reference to an undefined access pattern."""
+    addr_hex = f"{did_addr:#06x}"
+    result.add_error(
+        code=ErrorCodes.E004_UNDEFINED_ACCESS_PATTERN,
+        message=f"DID {addr_hex} references undefined access pattern '{access_pattern}'",
+        path=f"dids.{addr_hex}.access_pattern",
+        suggestion=f"Define '{access_pattern}' in 'access_patterns' section",
+    )
+
+
+def _validate_routine_access_patterns(
+    doc: DiagnosticDescription,
+    defined_patterns: Set[str],
+    result: ValidationResult,
+) -> None:
+    """Validate access pattern references in routines."""
+    if not doc.routines:
+        return
+
+    for routine_name, routine_def in doc.routines.items():
+        # Routines have no access_pattern field; it can only be an extra key
+        access_pattern = (routine_def.model_extra or {}).get("access_pattern")
+        if access_pattern and access_pattern not in defined_patterns:
+            result.add_error(
+                code=ErrorCodes.E004_UNDEFINED_ACCESS_PATTERN,
+                message=(
+                    f"Routine '{routine_name}' references undefined access pattern "
+                    f"'{access_pattern}'"
+                ),
+                path=f"routines.{routine_name}.access_pattern",
+                suggestion=f"Define '{access_pattern}' in 'access_patterns' section",
+            )
+
+
+def _validate_routine_params(
+    routine_param_refs: Iterable[tuple[int, str, str, str, str]],
+    defined_types: Set[str],
+    result: ValidationResult,
+) -> None:
+    """Validate type references in routine parameters."""
+    # References are grouped by routine; format each routine ID once
+    hex_id: int | None = None
+    rid_hex = ""
+    for routine_id, op_name, io_name, param_name, param_type in routine_param_refs:
+        if _is_undefined_type(param_type, defined_types):
+            if routine_id != hex_id:
+                hex_id = routine_id
+                rid_hex = f"{routine_id:#06x}"
+            result.add_error(
+                code=ErrorCodes.E001_UNDEFINED_TYPE,
+                message=(
+                    f"Routine {rid_hex} {op_name} {io_name} parameter "
+                    f"'{param_name}' references undefined type '{param_type}'"
+                ),
+                path=f"routines.{rid_hex}.parameters.{op_name}.{io_name}.{param_name}.type",
+                suggestion=f"Define '{param_type}' in the 'types' section",
+            )
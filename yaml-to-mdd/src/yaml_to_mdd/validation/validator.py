@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from yaml_to_mdd.validation.base import CompositeValidator
+from yaml_to_mdd.validation.base import BaseValidator, CompositeValidator
 from yaml_to_mdd.validation.consistency_validators import (
     DIDRangeValidator,
     DTCFormatValidator,
@@ -13,17 +13,33 @@ from yaml_to_mdd.validation.consistency_validators import (
     UniqueSessionIdValidator,
     UnusedDefinitionsValidator,
 )
-from yaml_to_mdd.validation.errors import ValidationResult, ValidationSeverity
+from yaml_to_mdd.validation.errors import ValidationResult
 from yaml_to_mdd.validation.reference_validators import (
-    AccessPatternReferenceValidator,
+    FusedReferenceValidator,
     SecurityReferenceValidator,
     SessionReferenceValidator,
-    TypeReferenceValidator,
 )
 
 if TYPE_CHECKING:
     from yaml_to_mdd.models.root import DiagnosticDescription
 
+# Validators keep no per-run state, so every DiagnosticValidator shares the
+# instances; each one builds its own pipeline around them
+_DEFAULT_VALIDATORS: tuple[BaseValidator, ...] = (
+    # Reference validators (type and access pattern checks share
+    # one pass over DIDs and routines)
+    FusedReferenceValidator(),
+    SessionReferenceValidator(),
+    SecurityReferenceValidator(),
+    # Consistency validators
+    UniqueSessionIdValidator(),
+    UniqueSecurityLevelValidator(),
+    DIDRangeValidator(),
+    DTCFormatValidator(),
+    RoutineIdRangeValidator(),
+    UnusedDefinitionsValidator(),
+)
+
 
 class DiagnosticValidator:
     """Main validator for diagnostic descriptions.
@@ -41,22 +57,7 @@ class DiagnosticValidator:
 
         """
         self.strict = strict
-        self._validator = CompositeValidator(
-            [
-                # Reference validators
-                TypeReferenceValidator(),
-                SessionReferenceValidator(),
-                SecurityReferenceValidator(),
-                AccessPatternReferenceValidator(),
-                # Consistency validators
-                UniqueSessionIdValidator(),
-                UniqueSecurityLevelValidator(),
-                DIDRangeValidator(),
-                DTCFormatValidator(),
-                RoutineIdRangeValidator(),
-                UnusedDefinitionsValidator(),
-            ]
-        )
+        self._validator = CompositeValidator(_DEFAULT_VALIDATORS)
 
     def validate(self, doc: DiagnosticDescription) -> ValidationResult:
         """Validate a diagnostic description.
@@ -91,7 +92,7 @@ class DiagnosticValidator:
         if not result.is_valid:
             raise ValidationError(result)
 
-        if self.strict and result.warnings:
+        if self.strict and result.warning_count:
             raise ValidationError(result)
 
 
@@ -107,8 +108,11 @@ class ValidationError(Exception):
 
         """
         self.result = result
-        error_count = len(result.errors)
-        warning_count = len(result.warnings)
+        # Filled on first use; the result is not modified after raising
+        self._formatted_issues: str | None = None
+        self._errors_only: tuple[str, ...] | None = None
+        error_count = result.error_count
+        warning_count = result.warning_count
 
         parts = []
         if error_count:
@@ -127,25 +131,27 @@ class ValidationError(Exception):
             Formatted string with all issues.
 
         """
-        lines = []
+        if self._formatted_issues is None:
+            lines = []
 
-        for issue in self.result.errors:
-            lines.append(f"ERROR: {issue}")
+            for issue in self.result.errors:
+                lines.append(f"ERROR: {issue}")
 
-        for issue in self.result.warnings:
-            lines.append(f"WARNING: {issue}")
+            for issue in self.result.warnings:
+                lines.append(f"WARNING: {issue}")
 
-        return "\n".join(lines)
+            self._formatted_issues = "\n".join(lines)
+        return self._formatted_issues
 
     @property
-    def errors_only(self) -> list[str]:
+    def errors_only(self) -> tuple[str, ...]:
         """Get only error messages.
 
         Returns
         -------
-            List of error message strings.
+            Tuple of error message strings.
 
         """
-        return [
-            str(issue) for issue in self.result.issues if issue.severity == ValidationSeverity.ERROR
-        ]
+        if self._errors_only is None:
+            self._errors_only = tuple(str(issue) for issue in self.result.errors)
+        return self._errors_only
@@ -4,20 +4,31 @@ from pathlib import Path
 
 import pytest
 
+_FIXTURES = Path(__file__).parent / "fixtures"
+_YAML_SCHEMA = Path(__file__).parent.parent.parent / "yaml-schema"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Return path to test fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+    return _FIXTURES
+
+
+def _schema_example(name: str) -> Path:
+    """Return path to a yaml-schema example file, skipping the test if it is absent."""
+    path = _YAML_SCHEMA / name
+    if not path.exists():
+        pytest.skip(f"{name} not found")
+    return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_ecu_yaml() -> Path:
     """Return path to minimal-ecu.yml test file."""
-    return Path(__file__).parent.parent.parent / "yaml-schema" / "minimal-ecu.yml"
+    return _schema_example("minimal-ecu.yml")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_ecm_yaml() -> Path:
     """Return path to example-ecm.yml test file."""
-    return Path(__file__).parent.parent.parent / "yaml-schema" / "example-ecm.yml"
+    return _schema_example("example-ecm.yml")
@@ -0,0 +1,46 @@
+"""Tests for the sample YAML fixtures shared by the integration tests."""
+
+from __future__ import annotations
+
+import pytest
+import yaml
+
+from tests.fixtures import sample_yamls
+from tests.fixtures.sample_yamls import MINIMAL_YAML, write_yaml
+from yaml_to_mdd.models import DiagnosticDescription, load_diagnostic_description
+
+
+class TestSampleYamls:
+    """Tests for the fixture dicts, their YAML texts and write_yaml."""
+
+    @pytest.mark.parametrize(
+        "data_name",
+        ["MINIMAL_YAML", "FULL_YAML", "YAML_WITH_MEMORY", "YAML_WITH_AUDIENCE"],
+    )
+    def test_written_file_matches_fixture_data(
+        self, tmp_path_factory: pytest.TempPathFactory, data_name: str
+    ) -> None:
+        """Should load each written fixture file to the same document as its source dict."""
+        data = getattr(sample_yamls, data_name)
+        yaml_path = write_yaml(tmp_path_factory, f"{data_name.lower()}.yaml", data)
+
+        doc = load_diagnostic_description(yaml_path)
+
+        assert doc == DiagnosticDescription.model_validate(data)
+
+    def test_fixtures_do_not_share_blocks(self) -> None:
+        """Should give each fixture its own copy of the shared blocks."""
+        errors_yaml = sample_yamls.YAML_WITH_ERRORS
+
+        assert MINIMAL_YAML["sessions"] == errors_yaml["sessions"]
+        assert MINIMAL_YAML["sessions"] is not errors_yaml["sessions"]
+        assert MINIMAL_YAML["ecu"]["addressing"] is not errors_yaml["ecu"]["addressing"]
+
+    def test_minimal_yaml_str_parses_hex_strings(self) -> None:
+        """Should load the hex-string YAML text to the same document as the dict fixture."""
+        data = yaml.safe_load(sample_yamls.MINIMAL_YAML_STR)
+
+        assert data["ecu"]["addressing"]["doip"]["logical_address"] == "0x0E80"
+        assert DiagnosticDescription.model_validate(data) == DiagnosticDescription.model_validate(
+            MINIMAL_YAML
+        )
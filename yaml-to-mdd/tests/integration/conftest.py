@@ -0,0 +1,89 @@
+"""Shared fixtures for integration tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.fixtures.sample_yamls import (
+    FULL_YAML,
+    MINIMAL_YAML,
+    YAML_WITH_AUDIENCE,
+    YAML_WITH_MEMORY,
+    write_yaml,
+)
+from yaml_to_mdd.converters import IRToFlatBuffersConverter, MDDWriter
+from yaml_to_mdd.models import load_diagnostic_description
+from yaml_to_mdd.transform import YamlToIRTransformer
+
+if TYPE_CHECKING:
+    from yaml_to_mdd.ir.database import IRDatabase
+    from yaml_to_mdd.models.root import DiagnosticDescription
+
+
+@pytest.fixture(scope="session")
+def minimal_yaml_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return path to a minimal YAML file, written once per session."""
+    return write_yaml(tmp_path_factory, "minimal.yaml", MINIMAL_YAML)
+
+
+@pytest.fixture(scope="session")
+def full_yaml_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return path to a full-featured YAML file, written once per session."""
+    return write_yaml(tmp_path_factory, "full.yaml", FULL_YAML)
+
+
+@pytest.fixture(scope="session")
+def full_doc(full_yaml_file: Path) -> DiagnosticDescription:
+    """Return the full-featured document, loaded once per session (read-only)."""
+    return load_diagnostic_description(full_yaml_file)
+
+
+@pytest.fixture(scope="session")
+def transformer() -> YamlToIRTransformer:
+    """Return a transformer shared by the session; transform() resets its state per call."""
+    return YamlToIRTransformer()
+
+
+@pytest.fixture(scope="session")
+def fbs_converter() -> IRToFlatBuffersConverter:
+    """Return a converter shared by the session; convert() resets its caches per call."""
+    return IRToFlatBuffersConverter()
+
+
+@pytest.fixture(scope="session")
+def mdd_writer() -> MDDWriter:
+    """Return an MDD writer with default settings, shared by the session (stateless)."""
+    return MDDWriter()
+
+
+@pytest.fixture(scope="session")
+def gzip_mdd_writer() -> MDDWriter:
+    """Return a gzip-compressing MDD writer, shared by the session (stateless)."""
+    return MDDWriter(compression="gzip")
+
+
+@pytest.fixture(scope="session")
+def full_ir_db(full_doc: DiagnosticDescription, transformer: YamlToIRTransformer) -> IRDatabase:
+    """Return the IR of the full-featured document, transformed once per session (read-only)."""
+    return transformer.transform(full_doc)
+
+
+@pytest.fixture(scope="session")
+def full_fbs_bytes(full_ir_db: IRDatabase, fbs_converter: IRToFlatBuffersConverter) -> bytes:
+    """Return the FlatBuffers encoding of the full-featured IR, built once per session."""
+    return fbs_converter.convert(full_ir_db)
+
+
+@pytest.fixture(scope="session")
+def memory_yaml_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return path to a YAML file with memory config, written once per session."""
+    return write_yaml(tmp_path_factory, "memory.yaml", YAML_WITH_MEMORY)
+
+
+@pytest.fixture(scope="session")
+def audience_yaml_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return path to a YAML file with audience config, written once per session."""
+    return write_yaml(tmp_path_factory, "audience.yaml", YAML_WITH_AUDIENCE)
@@ -8,23 +8,53 @@ Run with: pytest tests/integration/test_mdd_deep_comparison.py -v -s
 
 from __future__ import annotations
 
+import functools
 import gzip
+import hashlib
+import importlib.metadata
 import lzma
+import mmap
+import operator
+import os
+import pickle
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import pytest
 from yaml_to_mdd.converters.mdd_writer import FILE_MAGIC, convert_yaml_to_mdd
+from yaml_to_mdd.fbs_generated.dataformat.CodedConst import CodedConst
 from yaml_to_mdd.fbs_generated.dataformat.EcuData import EcuData
+from yaml_to_mdd.fbs_generated.dataformat.EcuSharedData import EcuSharedData
 from yaml_to_mdd.fbs_generated.dataformat.ParamSpecificData import ParamSpecificData
+from yaml_to_mdd.fbs_generated.dataformat.StandardLengthType import StandardLengthType
+from yaml_to_mdd.fbs_generated.dataformat.Value import Value
+from yaml_to_mdd.fbs_generated.dataformat.Variant import Variant
+from yaml_to_mdd.fbs_generated.dataformat.VariantPattern import VariantPattern
 from yaml_to_mdd.proto_generated import MDDFile
 
 # Path to golden test files
 GOLDEN_DIR = Path(__file__).parent / "golden"
 
+# Fields compared between ODX and YAML params, fetched as one tuple
+_PARAM_KEY = operator.attrgetter("short_name", "byte_position", "specific_data_type", "coded_value")
 
-@dataclass
+# Schema-version differences, resolved once per class instead of per object
+_HAS_PARENT_REFS = hasattr(Variant, "ParentRefsLength")
+_HAS_ECU_SHARED_DATA = hasattr(EcuData, "EcuSharedData")
+_HAS_SHARED_DOPS = hasattr(EcuSharedData, "DopsLength")
+if hasattr(VariantPattern, "MatchingParametersLength"):
+    _MP_LENGTH = VariantPattern.MatchingParametersLength
+    _GET_MP = VariantPattern.MatchingParameters
+elif hasattr(VariantPattern, "MatchingParameterLength"):
+    _MP_LENGTH = VariantPattern.MatchingParameterLength
+    _GET_MP = VariantPattern.MatchingParameter
+else:
+    _MP_LENGTH = _GET_MP = None
+
+
+@dataclass(slots=True)
 class ParamDetail:
     """Detailed parameter information."""
 
@@ -52,6 +82,17 @@ class ServiceDetail:
     pos_response_params: list[list[ParamDetail]] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class MatchingParamDetail:
+    """Variant pattern matching parameter information."""
+
+    expected_value: str | None
+    has_diag_service: bool
+    has_out_param: bool
+    diag_service_name: str | None = None
+    out_param_name: str | None = None
+
+
 @dataclass
 class VariantDetail:
     """Detailed variant information."""
@@ -63,7 +104,7 @@ class VariantDetail:
     com_param_refs_count: int = 0
     parent_refs_count: int = 0
     pattern_count: int = 0
-    matching_params: list[dict[str, Any]] = field(default_factory=list)
+    matching_params: list[MatchingParamDetail] = field(default_factory=list)
 
 
 @dataclass
@@ -85,6 +126,7 @@ class DeepMDDStructure:
 
     # Service details (from base variant)
     services: dict[str, ServiceDetail] = field(default_factory=dict)
+    service_names: frozenset[str] = frozenset()
 
     # Protocol info
     has_protocol_refs: bool = False
@@ -94,40 +136,75 @@ class DeepMDDStructure:
     shared_data_dops_count: int = 0
 
 
-def parse_mdd_deep(mdd_path: Path) -> DeepMDDStructure:
-    """Parse MDD file and extract deep structure details."""
-    with open(mdd_path, "rb") as f:
-        raw_data = f.read()
+@functools.cache
+def _decode_cached(raw: bytes) -> str:
+    """Decode a FlatBuffers string once per distinct value."""
+    return raw.decode()
+
+
+def _decode(raw: bytes | None) -> str | None:
+    """Decode an optional FlatBuffers string field, sharing one str per value."""
+    return _decode_cached(raw) if raw else None
+
+
+def _decompress_chunk(chunk: Any) -> bytes:
+    """Return the FlatBuffers payload of a chunk, decompressing it if needed."""
+    compression = chunk.compression_algorithm
+    if not compression or compression == "none":
+        return chunk.data
+    if compression == "lzma":
+        return lzma.decompress(chunk.data)
+    if compression == "gzip":
+        return gzip.decompress(chunk.data)
+    if compression == "zstd":
+        zstd = pytest.importorskip("zstandard")
+        return zstd.ZstdDecompressor().decompress(chunk.data)
+    raise ValueError(f"Unknown compression algorithm: {compression}")
 
-    structure = DeepMDDStructure(file_size=len(raw_data))
 
-    if not raw_data.startswith(FILE_MAGIC):
-        raise ValueError(f"Invalid MDD file: {mdd_path}")
+def _read_diag_payload(mdd_path: Path, structure: DeepMDDStructure) -> bytes | None:
+    """Read the MDD container and return the decompressed diagnostic chunk payload.
 
-    # Parse protobuf
+    The file is mapped rather than read, and the protobuf message is local to
+    this function, so both are released before the caller walks the
+    FlatBuffers tree.
+    """
     mdd = MDDFile()
-    mdd.ParseFromString(raw_data[len(FILE_MAGIC) :])
+    with (
+        open(mdd_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        memoryview(mm) as view,
+    ):
+        structure.file_size = len(mm)
+
+        if view[: len(FILE_MAGIC)] != FILE_MAGIC:
+            raise ValueError(f"Invalid MDD file: {mdd_path}")
+
+        # Parse protobuf; the message keeps its own copy of the chunk data
+        mdd.ParseFromString(view[len(FILE_MAGIC) :])
 
     structure.ecu_name = mdd.ecu_name
     structure.revision = mdd.revision
     structure.chunk_count = len(mdd.chunks)
 
     # Find and decompress diagnostic chunk
-    fbs_data = None
     for chunk in mdd.chunks:
         if chunk.type == 0 or chunk.name == "diagnostic_description":
             structure.chunk_compression = chunk.compression_algorithm or "none"
             structure.chunk_data_size = len(chunk.data)
 
-            if chunk.compression_algorithm == "lzma":
-                fbs_data = lzma.decompress(chunk.data)
-            elif chunk.compression_algorithm == "gzip":
-                fbs_data = gzip.decompress(chunk.data)
-            else:
-                fbs_data = chunk.data
+            fbs_data = _decompress_chunk(chunk)
 
             structure.decompressed_size = len(fbs_data)
-            break
+            return fbs_data
+
+    return None
+
+
+def parse_mdd_deep(mdd_path: Path) -> DeepMDDStructure:
+    """Parse MDD file and extract deep structure details."""
+    structure = DeepMDDStructure()
+    fbs_data = _read_diag_payload(mdd_path, structure)
 
     if fbs_data is None:
         return structure
@@ -145,11 +222,7 @@ def parse_mdd_deep(mdd_path: Path) -> DeepMDDStructure:
 
         diag_layer = variant.DiagLayer()
         v_detail = VariantDetail(
-            short_name=(
-                diag_layer.ShortName().decode()
-                if diag_layer and diag_layer.ShortName()
-                else f"variant_{i}"
-            ),
+            short_name=(diag_layer and _decode(diag_layer.ShortName())) or f"variant_{i}",
             is_base_variant=variant.IsBaseVariant(),
         )
 
@@ -159,7 +232,7 @@ def parse_mdd_deep(mdd_path: Path) -> DeepMDDStructure:
             v_detail.com_param_refs_count = diag_layer.ComParamRefsLength()
 
         # Parent refs
-        if hasattr(variant, "ParentRefsLength"):
+        if _HAS_PARENT_REFS:
             v_detail.parent_refs_count = variant.ParentRefsLength()
             if v_detail.parent_refs_count > 0:
                 structure.has_protocol_refs = True
@@ -168,40 +241,22 @@ def parse_mdd_deep(mdd_path: Path) -> DeepMDDStructure:
         v_detail.pattern_count = variant.VariantPatternLength()
         for j in range(variant.VariantPatternLength()):
             pattern = variant.VariantPattern(j)
-            if pattern:
-                # Handle both schema versions
-                mp_length = 0
-                get_mp = None
-                if hasattr(pattern, "MatchingParametersLength"):
-                    mp_length = pattern.MatchingParametersLength()
-                    get_mp = pattern.MatchingParameters
-                elif hasattr(pattern, "MatchingParameterLength"):
-                    mp_length = pattern.MatchingParameterLength()
-                    get_mp = pattern.MatchingParameter
-
-                for k in range(mp_length):
-                    mp = get_mp(k) if get_mp else None
+            if pattern and _GET_MP is not None:
+                for k in range(_MP_LENGTH(pattern)):
+                    mp = _GET_MP(pattern, k)
                     if mp:
-                        mp_info: dict[str, Any] = {
-                            "expected_value": (
-                                mp.ExpectedValue().decode() if mp.ExpectedValue() else None
-                            ),
-                            "has_diag_service": mp.DiagService() is not None,
-                            "has_out_param": mp.OutParam() is not None,
-                        }
-                        if mp.DiagService():
-                            dc = mp.DiagService().DiagComm()
-                            mp_info["diag_service_name"] = (
-                                dc.ShortName().decode() if dc and dc.ShortName() else None
-                            )
-                        if mp.OutParam():
-                            out_param = mp.OutParam()
-                            mp_info["out_param_name"] = (
-                                out_param.ShortName().decode()
-                                if out_param and out_param.ShortName()
-                                else None
+                        diag_service = mp.DiagService()
+                        out_param = mp.OutParam()
+                        dc = diag_service.DiagComm() if diag_service else None
+                        v_detail.matching_params.append(
+                            MatchingParamDetail(
+                                expected_value=_decode(mp.ExpectedValue()),
+                                has_diag_service=diag_service is not None,
+                                has_out_param=out_param is not None,
+                                diag_service_name=dc and _decode(dc.ShortName()),
+                                out_param_name=out_param and _decode(out_param.ShortName()),
                             )
-                        v_detail.matching_params.append(mp_info)
+                        )
 
         structure.variants.append(v_detail)
 
@@ -210,13 +265,14 @@ def parse_mdd_deep(mdd_path: Path) -> DeepMDDStructure:
             _extract_services_deep(diag_layer, structure)
 
     # EcuSharedData
-    if hasattr(ecu_data, "EcuSharedData"):
+    if _HAS_ECU_SHARED_DATA:
         ecu_shared = ecu_data.EcuSharedData()
         if ecu_shared:
             structure.has_ecu_shared_data = True
-            if hasattr(ecu_shared, "DopsLength"):
+            if _HAS_SHARED_DOPS:
                 structure.shared_data_dops_count = ecu_shared.DopsLength()
 
+    structure.service_names = frozenset(structure.services)
     return structure
 
 
@@ -228,30 +284,22 @@ def _extract_services_deep(diag_layer: Any, structure: DeepMDDStructure) -> None
             continue
 
         dc = service.DiagComm()
-        svc_name = dc.ShortName().decode() if dc and dc.ShortName() else f"service_{i}"
+        svc_name = (dc and _decode(dc.ShortName())) or f"service_{i}"
 
         svc_detail = ServiceDetail(short_name=svc_name)
 
         # Request params
         request = service.Request()
         if request:
-            for j in range(request.ParamsLength()):
-                param = request.Params(j)
-                if param:
-                    p_detail = _extract_param_detail(param)
-                    svc_detail.request_params.append(p_detail)
+            svc_detail.request_params = _extract_params(request)
 
         # Positive responses
         svc_detail.pos_response_count = service.PosResponsesLength()
-        for j in range(service.PosResponsesLength()):
-            resp = service.PosResponses(j)
-            if resp:
-                resp_params: list[ParamDetail] = []
-                for k in range(resp.ParamsLength()):
-                    param = resp.Params(k)
-                    if param:
-                        resp_params.append(_extract_param_detail(param))
-                svc_detail.pos_response_params.append(resp_params)
+        svc_detail.pos_response_params = [
+            _extract_params(resp)
+            for resp in map(service.PosResponses, range(svc_detail.pos_response_count))
+            if resp
+        ]
 
         # Negative responses
         svc_detail.neg_response_count = service.NegResponsesLength()
@@ -259,19 +307,22 @@ def _extract_services_deep(diag_layer: Any, structure: DeepMDDStructure) -> None
         structure.services[svc_name] = svc_detail
 
 
+def _extract_params(message: Any) -> list[ParamDetail]:
+    """Extract details of all parameters of a request or response in one pass."""
+    return [
+        _extract_param_detail(param)
+        for param in map(message.Params, range(message.ParamsLength()))
+        if param
+    ]
+
+
 def _extract_param_detail(param: Any) -> ParamDetail:
     """Extract detailed parameter information."""
-    from yaml_to_mdd.fbs_generated.dataformat.CodedConst import CodedConst
-    from yaml_to_mdd.fbs_generated.dataformat.StandardLengthType import (
-        StandardLengthType,
-    )
-    from yaml_to_mdd.fbs_generated.dataformat.Value import Value
-
     p = ParamDetail(
-        short_name=param.ShortName().decode() if param.ShortName() else "?",
+        short_name=_decode(param.ShortName()) or "?",
         byte_position=param.BytePosition(),
         bit_position=param.BitPosition(),
-        semantic=param.Semantic().decode() if param.Semantic() else None,
+        semantic=_decode(param.Semantic()),
         specific_data_type=param.SpecificDataType(),
     )
 
@@ -281,7 +332,7 @@ def _extract_param_detail(param: Any) -> ParamDetail:
         if sd:
             cc = CodedConst()
             cc.Init(sd.Bytes, sd.Pos)
-            p.coded_value = cc.CodedValue().decode() if cc.CodedValue() else None
+            p.coded_value = _decode(cc.CodedValue())
             dct = cc.DiagCodedType()
             if dct:
                 p.diag_coded_type_base = dct.BaseDataType()
@@ -304,6 +355,102 @@ def _extract_param_detail(param: Any) -> ParamDetail:
     return p
 
 
+def _parse_cache_fingerprint() -> str:
+    """Fingerprint everything a pickled ``DeepMDDStructure`` depends on besides the MDD.
+
+    Covers this module (the parser and dataclasses), the generated FlatBuffers
+    bindings it reads through, and the flatbuffers/protobuf library versions.
+    """
+    bindings_dir = Path(sys.modules[Variant.__module__].__file__ or "").parent
+    parts = []
+    for path in (Path(__file__), *sorted(bindings_dir.glob("*.py"))):
+        st = path.stat()
+        parts.append(f"{path.name}:{st.st_size}:{st.st_mtime_ns}")
+    for dist in ("flatbuffers", "protobuf"):
+        parts.append(f"{dist}={importlib.metadata.version(dist)}")
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def _parse_mdd_deep_cached(mdd_path: Path, config: pytest.Config) -> DeepMDDStructure:
+    """Parse an MDD file, reusing the pickled result of an earlier run while it is unchanged.
+
+    The pickle lives in the pytest cache (so ``--cache-clear`` drops it) and is keyed
+    on the MDD file's size and mtime plus ``_parse_cache_fingerprint()``. Writes go
+    through a temporary file and ``os.replace`` so concurrent xdist workers never
+    see a partial pickle; an unreadable pickle counts as a miss, and entries for
+    the same MDD under any other key are pruned.
+    """
+    cache: pytest.Cache | None = getattr(config, "cache", None)
+    if cache is None:  # cacheprovider plugin disabled
+        return parse_mdd_deep(mdd_path)
+
+    mdd_stat = mdd_path.stat()
+    key = f"{mdd_stat.st_size}_{mdd_stat.st_mtime_ns}_{_parse_cache_fingerprint()}"
+    cache_dir = cache.mkdir("mdd_deep")
+    pickle_path = cache_dir / f"{mdd_path.stem}_{key}.pkl"
+    try:
+        structure: DeepMDDStructure = pickle.loads(pickle_path.read_bytes())
+        return structure
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        pass
+
+    structure = parse_mdd_deep(mdd_path)
+    tmp_path = pickle_path.with_name(f"{pickle_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(pickle.dumps(structure))
+    os.replace(tmp_path, pickle_path)
+
+    for stale in cache_dir.glob(f"{mdd_path.stem}_*.pkl"):
+        if stale != pickle_path:
+            stale.unlink(missing_ok=True)
+    return structure
+
+
+# Golden-file fixtures are session-scoped so each MDD is converted and parsed once
+@pytest.fixture(scope="session")
+def flxc1000_yaml_path() -> Path:
+    """FLXC1000 YAML source file."""
+    path = GOLDEN_DIR / "FLXC1000_yaml.yaml"
+    if not path.exists():
+        pytest.skip(f"YAML not found: {path}")
+    return path
+
+
+@pytest.fixture(scope="session")
+def flxc1000_odx_mdd() -> Path:
+    """FLXC1000 reference MDD from ODX."""
+    path = GOLDEN_DIR / "FLXC1000.mdd"
+    if not path.exists():
+        pytest.skip(f"Reference MDD not found: {path}")
+    return path
+
+
+@pytest.fixture(scope="session")
+def flxc1000_yaml_mdd(flxc1000_yaml_path: Path, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Generate MDD from YAML."""
+    output = tmp_path_factory.mktemp("mdd") / "flxc1000_yaml.mdd"
+    convert_yaml_to_mdd(flxc1000_yaml_path, output)
+    return output
+
+
+@pytest.fixture(scope="session")
+def odx_structure(flxc1000_odx_mdd: Path, pytestconfig: pytest.Config) -> DeepMDDStructure:
+    """Parse ODX-generated MDD (shared, read-only)."""
+    return _parse_mdd_deep_cached(flxc1000_odx_mdd, pytestconfig)
+
+
+@pytest.fixture(scope="session")
+def yaml_structure(flxc1000_yaml_mdd: Path) -> DeepMDDStructure:
+    """Parse YAML-generated MDD (shared, read-only)."""
+    return parse_mdd_deep(flxc1000_yaml_mdd)
+
+
+# Class scope so it also follows the testcontainer class's structure overrides
+@pytest.fixture(scope="class")
+def common_services(odx_structure: DeepMDDStructure, yaml_structure: DeepMDDStructure) -> list[str]:
+    """Sorted names of services present in both MDDs."""
+    return sorted(odx_structure.service_names & yaml_structure.service_names)
+
+
 class TestTestcontainerMDDComparison:
     """Direct comparison of testcontainer MDD files (ODX vs YAML generated)."""
 
@@ -311,7 +458,7 @@ class TestTestcontainerMDDComparison:
         "/home/bartosz-burda/workspace/classic-diagnostic-adapter/testcontainer"
     )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def flxc1000_odx_mdd(self) -> Path:
         """FLXC1000 ODX-generated MDD."""
         path = self.TESTCONTAINER_DIR / "odx" / "FLXC1000.mdd"
@@ -319,22 +466,24 @@ class TestTestcontainerMDDComparison:
             pytest.skip(f"ODX MDD not found: {path}")
         return path
 
-    @pytest.fixture
-    def flxc1000_yaml_mdd(self, tmp_path: Path) -> Path:
+    @pytest.fixture(scope="class")
+    def flxc1000_yaml_mdd(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
         """FLXC1000 YAML-generated MDD (converted from YAML source at test time)."""
         yaml_source = self.TESTCONTAINER_DIR / "yaml" / "FLXC1000_yaml.yaml"
         if not yaml_source.exists():
             pytest.skip(f"YAML source not found: {yaml_source}")
-        output = tmp_path / "FLXC1000_yaml.mdd"
+        output = tmp_path_factory.mktemp("mdd") / "FLXC1000_yaml.mdd"
         convert_yaml_to_mdd(yaml_source, output)
         return output
 
-    @pytest.fixture
-    def odx_structure(self, flxc1000_odx_mdd: Path) -> DeepMDDStructure:
+    @pytest.fixture(scope="class")
+    def odx_structure(
+        self, flxc1000_odx_mdd: Path, pytestconfig: pytest.Config
+    ) -> DeepMDDStructure:
         """Parse ODX-generated MDD."""
-        return parse_mdd_deep(flxc1000_odx_mdd)
+        return _parse_mdd_deep_cached(flxc1000_odx_mdd, pytestconfig)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def yaml_structure(self, flxc1000_yaml_mdd: Path) -> DeepMDDStructure:
         """Parse YAML-generated MDD."""
         return parse_mdd_deep(flxc1000_yaml_mdd)
@@ -393,8 +542,8 @@ class TestTestcontainerMDDComparison:
         self, odx_structure: DeepMDDStructure, yaml_structure: DeepMDDStructure
     ) -> None:
         """Compare service counts from testcontainer MDDs."""
-        odx_services = set(odx_structure.services.keys())
-        yaml_services = set(yaml_structure.services.keys())
+        odx_services = odx_structure.service_names
+        yaml_services = yaml_structure.service_names
 
         print("\n=== SERVICE COUNT (TESTCONTAINER) ===")
         print(f"ODX services:  {len(odx_services)}")
@@ -411,14 +560,15 @@ class TestTestcontainerMDDComparison:
             print(f"Extra in YAML:   {sorted(extra)}")
 
     def test_service_request_params_testcontainer(
-        self, odx_structure: DeepMDDStructure, yaml_structure: DeepMDDStructure
+        self,
+        odx_structure: DeepMDDStructure,
+        yaml_structure: DeepMDDStructure,
+        common_services: list[str],
     ) -> None:
         """Compare service request parameters from testcontainer MDDs."""
         print("\n=== SERVICE REQUEST PARAMETERS (TESTCONTAINER) ===")
 
-        common_services = set(odx_structure.services.keys()) & set(yaml_structure.services.keys())
-
-        for svc_name in sorted(common_services)[:8]:
+        for svc_name in common_services[:8]:
             odx_svc = odx_structure.services[svc_name]
             yaml_svc = yaml_structure.services[svc_name]
 
@@ -433,12 +583,7 @@ class TestTestcontainerMDDComparison:
 
                 if odx_p and yaml_p:
                     # Check if they differ
-                    differs = (
-                        odx_p.short_name != yaml_p.short_name
-                        or odx_p.byte_position != yaml_p.byte_position
-                        or odx_p.specific_data_type != yaml_p.specific_data_type
-                        or odx_p.coded_value != yaml_p.coded_value
-                    )
+                    differs = _PARAM_KEY(odx_p) != _PARAM_KEY(yaml_p)
                     marker = "  DIFF" if differs else ""
                 else:
                     marker = "  MISSING"
@@ -466,9 +611,9 @@ class TestTestcontainerMDDComparison:
                 if v.matching_params:
                     print(f"\n{label} {v.short_name}:")
                     for mp in v.matching_params:
-                        print(f"  - expected_value: {mp.get('expected_value')}")
-                        print(f"    diag_service: {mp.get('diag_service_name')}")
-                        print(f"    out_param: {mp.get('out_param_name')}")
+                        print(f"  - expected_value: {mp.expected_value}")
+                        print(f"    diag_service: {mp.diag_service_name}")
+                        print(f"    out_param: {mp.out_param_name}")
 
         show_matching_params(odx_structure, "ODX")
         print("-" * 40)
@@ -488,39 +633,6 @@ class TestTestcontainerMDDComparison:
 class TestDeepMDDComparison:
     """Deep comparison tests between YAML-generated and ODX-generated MDDs."""
 
-    @pytest.fixture
-    def flxc1000_yaml_path(self) -> Path:
-        """FLXC1000 YAML source file."""
-        path = GOLDEN_DIR / "FLXC1000_yaml.yaml"
-        if not path.exists():
-            pytest.skip(f"YAML not found: {path}")
-        return path
-
-    @pytest.fixture
-    def flxc1000_odx_mdd(self) -> Path:
-        """FLXC1000 reference MDD from ODX."""
-        path = GOLDEN_DIR / "FLXC1000.mdd"
-        if not path.exists():
-            pytest.skip(f"Reference MDD not found: {path}")
-        return path
-
-    @pytest.fixture
-    def flxc1000_yaml_mdd(self, flxc1000_yaml_path: Path, tmp_path: Path) -> Path:
-        """Generate MDD from YAML."""
-        output = tmp_path / "flxc1000_yaml.mdd"
-        convert_yaml_to_mdd(flxc1000_yaml_path, output)
-        return output
-
-    @pytest.fixture
-    def odx_structure(self, flxc1000_odx_mdd: Path) -> DeepMDDStructure:
-        """Parse ODX-generated MDD."""
-        return parse_mdd_deep(flxc1000_odx_mdd)
-
-    @pytest.fixture
-    def yaml_structure(self, flxc1000_yaml_mdd: Path) -> DeepMDDStructure:
-        """Parse YAML-generated MDD."""
-        return parse_mdd_deep(flxc1000_yaml_mdd)
-
     def test_file_sizes(
         self, odx_structure: DeepMDDStructure, yaml_structure: DeepMDDStructure
     ) -> None:
@@ -599,9 +711,9 @@ class TestDeepMDDComparison:
             if v.matching_params:
                 print(f"\nODX {v.short_name}:")
                 for mp in v.matching_params:
-                    print(f"  - expected_value: {mp.get('expected_value')}")
-                    print(f"    diag_service: {mp.get('diag_service_name')}")
-                    print(f"    out_param: {mp.get('out_param_name')}")
+                    print(f"  - expected_value: {mp.expected_value}")
+                    print(f"    diag_service: {mp.diag_service_name}")
+                    print(f"    out_param: {mp.out_param_name}")
 
         print("-" * 40)
 
@@ -609,16 +721,16 @@ class TestDeepMDDComparison:
             if v.matching_params:
                 print(f"\nYAML {v.short_name}:")
                 for mp in v.matching_params:
-                    print(f"  - expected_value: {mp.get('expected_value')}")
-                    print(f"    diag_service: {mp.get('diag_service_name')}")
-                    print(f"    out_param: {mp.get('out_param_name')}")
+                    print(f"  - expected_value: {mp.expected_value}")
+                    print(f"    diag_service: {mp.diag_service_name}")
+                    print(f"    out_param: {mp.out_param_name}")
 
     def test_service_names(
         self, odx_structure: DeepMDDStructure, yaml_structure: DeepMDDStructure
     ) -> None:
         """Compare service names."""
-        odx_services = set(odx_structure.services.keys())
-        yaml_services = set(yaml_structure.services.keys())
+        odx_services = odx_structure.service_names
+        yaml_services = yaml_structure.service_names
 
         print("\n=== SERVICE NAMES ===")
         print(f"ODX services:  {len(odx_services)}")
@@ -633,15 +745,15 @@ class TestDeepMDDComparison:
             print(f"\nExtra in YAML:   {sorted(extra)}")
 
     def test_service_request_params(
-        self, odx_structure: DeepMDDStructure, yaml_structure: DeepMDDStructure
+        self,
+        odx_structure: DeepMDDStructure,
+        yaml_structure: DeepMDDStructure,
+        common_services: list[str],
     ) -> None:
         """Compare service request parameters in detail."""
         print("\n=== SERVICE REQUEST PARAMETERS ===")
 
-        # Find common services
-        common_services = set(odx_structure.services.keys()) & set(yaml_structure.services.keys())
-
-        for svc_name in sorted(common_services)[:5]:  # Limit to first 5 for readability
+        for svc_name in common_services[:5]:  # Limit to first 5 for readability
             odx_svc = odx_structure.services[svc_name]
             yaml_svc = yaml_structure.services[svc_name]
 
@@ -703,22 +815,15 @@ class TestDeepMDDComparison:
         - Functional parity (same services, params, responses)
         - Detecting missing or extra content
         """
-        from yaml_to_mdd.fbs_generated.dataformat.EcuData import EcuData
 
         def load_fbs(mdd_path: Path) -> bytes:
             with open(mdd_path, "rb") as f:
                 data = f.read()
             mdd = MDDFile()
-            mdd.ParseFromString(data[len(FILE_MAGIC) :])
+            mdd.ParseFromString(memoryview(data)[len(FILE_MAGIC) :])
             for chunk in mdd.chunks:
                 if chunk.type == 0 or chunk.name == "diagnostic_description":
-                    compression = chunk.compression_algorithm
-                    if not compression or compression == "none":
-                        return chunk.data
-                    elif compression == "lzma":
-                        return lzma.decompress(chunk.data)
-                    elif compression == "gzip":
-                        return gzip.decompress(chunk.data)
+                    return _decompress_chunk(chunk)
             return b""
 
         def count_objects(ecu: Any) -> dict:
@@ -834,39 +939,6 @@ class TestDeepMDDComparison:
 class TestDetailedServiceComparison:
     """Detailed per-service comparison tests."""
 
-    @pytest.fixture
-    def flxc1000_yaml_path(self) -> Path:
-        """FLXC1000 YAML source file."""
-        path = GOLDEN_DIR / "FLXC1000_yaml.yaml"
-        if not path.exists():
-            pytest.skip(f"YAML not found: {path}")
-        return path
-
-    @pytest.fixture
-    def flxc1000_odx_mdd(self) -> Path:
-        """FLXC1000 reference MDD from ODX."""
-        path = GOLDEN_DIR / "FLXC1000.mdd"
-        if not path.exists():
-            pytest.skip(f"Reference MDD not found: {path}")
-        return path
-
-    @pytest.fixture
-    def flxc1000_yaml_mdd(self, flxc1000_yaml_path: Path, tmp_path: Path) -> Path:
-        """Generate MDD from YAML."""
-        output = tmp_path / "flxc1000_yaml.mdd"
-        convert_yaml_to_mdd(flxc1000_yaml_path, output)
-        return output
-
-    @pytest.fixture
-    def odx_structure(self, flxc1000_odx_mdd: Path) -> DeepMDDStructure:
-        """Parse ODX-generated MDD."""
-        return parse_mdd_deep(flxc1000_odx_mdd)
-
-    @pytest.fixture
-    def yaml_structure(self, flxc1000_yaml_mdd: Path) -> DeepMDDStructure:
-        """Parse YAML-generated MDD."""
-        return parse_mdd_deep(flxc1000_yaml_mdd)
-
     def test_identification_read_service(
         self, odx_structure: DeepMDDStructure, yaml_structure: DeepMDDStructure
     ) -> None:
@@ -929,39 +1001,6 @@ class TestDetailedServiceComparison:
 class TestParamTypeDistribution:
     """Analyze distribution of parameter types."""
 
-    @pytest.fixture
-    def flxc1000_yaml_path(self) -> Path:
-        """FLXC1000 YAML source file."""
-        path = GOLDEN_DIR / "FLXC1000_yaml.yaml"
-        if not path.exists():
-            pytest.skip(f"YAML not found: {path}")
-        return path
-
-    @pytest.fixture
-    def flxc1000_odx_mdd(self) -> Path:
-        """FLXC1000 reference MDD from ODX."""
-        path = GOLDEN_DIR / "FLXC1000.mdd"
-        if not path.exists():
-            pytest.skip(f"Reference MDD not found: {path}")
-        return path
-
-    @pytest.fixture
-    def flxc1000_yaml_mdd(self, flxc1000_yaml_path: Path, tmp_path: Path) -> Path:
-        """Generate MDD from YAML."""
-        output = tmp_path / "flxc1000_yaml.mdd"
-        convert_yaml_to_mdd(flxc1000_yaml_path, output)
-        return output
-
-    @pytest.fixture
-    def odx_structure(self, flxc1000_odx_mdd: Path) -> DeepMDDStructure:
-        """Parse ODX-generated MDD."""
-        return parse_mdd_deep(flxc1000_odx_mdd)
-
-    @pytest.fixture
-    def yaml_structure(self, flxc1000_yaml_mdd: Path) -> DeepMDDStructure:
-        """Parse YAML-generated MDD."""
-        return parse_mdd_deep(flxc1000_yaml_mdd)
-
     def test_param_type_distribution(
         self, odx_structure: DeepMDDStructure, yaml_structure: DeepMDDStructure
     ) -> None:
@@ -986,14 +1025,13 @@ class TestParamTypeDistribution:
         }
 
         def count_param_types(structure: DeepMDDStructure) -> Counter:
-            counter: Counter = Counter()
-            for svc in structure.services.values():
-                for p in svc.request_params:
-                    counter[p.specific_data_type] += 1
-                for resp_params in svc.pos_response_params:
-                    for p in resp_params:
-                        counter[p.specific_data_type] += 1
-            return counter
+            # One pass over request and positive-response params of every service
+            return Counter(
+                p.specific_data_type
+                for svc in structure.services.values()
+                for params in (svc.request_params, *svc.pos_response_params)
+                for p in params
+            )
 
         odx_counts = count_param_types(odx_structure)
         yaml_counts = count_param_types(yaml_structure)
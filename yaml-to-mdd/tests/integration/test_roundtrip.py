@@ -5,11 +5,10 @@ Tests that data survives the full round-trip conversion and maintains integrity.
 
 from __future__ import annotations
 
-import tempfile
+import functools
 from pathlib import Path
 from typing import Any
 
-import yaml
 from yaml_to_mdd.converters import IRToFlatBuffersConverter, MDDWriter
 from yaml_to_mdd.converters.mdd_writer import FILE_MAGIC
 from yaml_to_mdd.fbs_generated.dataformat.DiagLayer import DiagLayer
@@ -18,8 +17,6 @@ from yaml_to_mdd.models import load_diagnostic_description
 from yaml_to_mdd.proto_generated import MDDFile
 from yaml_to_mdd.transform import YamlToIRTransformer
 
-from tests.fixtures.sample_yamls import FULL_YAML, MINIMAL_YAML, YAML_WITH_MEMORY
-
 
 def get_diag_layer_from_fbs(fbs_bytes: bytes) -> DiagLayer:
     """Extract DiagLayer from FlatBuffers bytes (EcuData root).
@@ -31,21 +28,27 @@ def get_diag_layer_from_fbs(fbs_bytes: bytes) -> DiagLayer:
     return variant.DiagLayer()
 
 
+@functools.cache
+def _convert_yaml_file(yaml_path: Path) -> tuple[Any, bytes]:
+    """Load a YAML file and convert it to MDD bytes, once per session per file.
+
+    The tests only read the results, so the expensive load, transform and
+    write steps are shared by every test converting the same session fixture.
+    """
+    doc = load_diagnostic_description(yaml_path)
+    transformer = YamlToIRTransformer()
+    ir_db = transformer.transform(doc)
+
+    writer = MDDWriter()
+    return doc, writer.write_bytes(ir_db)
+
+
 class TestDataIntegrity:
     """Tests for data integrity through the conversion pipeline."""
 
-    def _load_and_convert(self, yaml_data: dict[str, Any]) -> tuple[Any, bytes, MDDFile]:
+    def _load_and_convert(self, yaml_path: Path) -> tuple[Any, bytes, MDDFile]:
         """Load YAML, convert to MDD, and return components for testing."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(yaml_data, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
-        transformer = YamlToIRTransformer()
-        ir_db = transformer.transform(doc)
-
-        writer = MDDWriter()
-        mdd_bytes = writer.write_bytes(ir_db)
+        doc, mdd_bytes = _convert_yaml_file(yaml_path)
 
         # Strip FILE_MAGIC header before parsing protobuf
         protobuf_bytes = mdd_bytes[len(FILE_MAGIC) :]
@@ -55,27 +58,27 @@ class TestDataIntegrity:
 
         return doc, mdd_bytes, mdd
 
-    def test_ecu_id_preserved(self) -> None:
+    def test_ecu_id_preserved(self, minimal_yaml_file: Path) -> None:
         """ECU ID should be preserved through conversion."""
-        doc, _, mdd = self._load_and_convert(MINIMAL_YAML)
+        doc, _, mdd = self._load_and_convert(minimal_yaml_file)
         assert mdd.ecu_name == doc.ecu.id
         assert mdd.ecu_name == "MINIMAL_ECU"
 
-    def test_revision_preserved(self) -> None:
+    def test_revision_preserved(self, full_yaml_file: Path) -> None:
         """Revision should be preserved through conversion."""
-        doc, _, mdd = self._load_and_convert(FULL_YAML)
+        doc, _, mdd = self._load_and_convert(full_yaml_file)
         assert mdd.revision == doc.meta.revision
         assert mdd.revision == "2.5.0"
 
-    def test_author_preserved(self) -> None:
+    def test_author_preserved(self, full_yaml_file: Path) -> None:
         """Author should be preserved in metadata."""
-        doc, _, mdd = self._load_and_convert(FULL_YAML)
+        doc, _, mdd = self._load_and_convert(full_yaml_file)
         assert mdd.metadata["author"] == doc.meta.author
         assert mdd.metadata["author"] == "Integration Test Suite"
 
-    def test_did_count_preserved(self) -> None:
+    def test_did_count_preserved(self, full_yaml_file: Path) -> None:
         """Number of DIDs should be preserved in services."""
-        doc, _, mdd = self._load_and_convert(FULL_YAML)
+        doc, _, mdd = self._load_and_convert(full_yaml_file)
 
         # Get FlatBuffers data from chunk (decompress if needed)
         chunk = mdd.chunks[0]
@@ -97,16 +100,12 @@ class TestDataIntegrity:
         service_count = diag_layer.DiagServicesLength()
         assert service_count > 0
 
-    def test_dtc_count_preserved(self) -> None:
+    def test_dtc_count_preserved(self, full_yaml_file: Path) -> None:
         """Number of DTCs should be preserved."""
-        doc, _, _ = self._load_and_convert(FULL_YAML)
+        doc, _, _ = self._load_and_convert(full_yaml_file)
 
         # Load again and transform to check IR
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(FULL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc2 = load_diagnostic_description(yaml_path)
+        doc2 = load_diagnostic_description(full_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc2)
 
@@ -114,13 +113,9 @@ class TestDataIntegrity:
         assert len(ir_db.dtcs) == len(doc.dtcs)
         assert len(ir_db.dtcs) == 3
 
-    def test_session_mappings_preserved(self) -> None:
+    def test_session_mappings_preserved(self, full_yaml_file: Path) -> None:
         """Session mappings should be preserved in IR."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(FULL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(full_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -135,13 +130,9 @@ class TestDataIntegrity:
         assert ir_db.sessions["programming"] == 0x02
         assert ir_db.sessions["extended"] == 0x03
 
-    def test_security_levels_preserved(self) -> None:
+    def test_security_levels_preserved(self, full_yaml_file: Path) -> None:
         """Security level mappings should be preserved in IR."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(FULL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(full_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -154,13 +145,9 @@ class TestDataIntegrity:
 class TestMemoryRoundTrip:
     """Tests for memory configuration data integrity."""
 
-    def test_memory_regions_preserved(self) -> None:
+    def test_memory_regions_preserved(self, memory_yaml_file: Path) -> None:
         """Memory regions should be preserved through conversion."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(YAML_WITH_MEMORY, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(memory_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -173,13 +160,9 @@ class TestMemoryRoundTrip:
         assert app_flash.size == 0x000F0000
         assert app_flash.access == "read_write"
 
-    def test_data_blocks_preserved(self) -> None:
+    def test_data_blocks_preserved(self, memory_yaml_file: Path) -> None:
         """Data blocks should be preserved through conversion."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(YAML_WITH_MEMORY, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(memory_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -195,13 +178,9 @@ class TestMemoryRoundTrip:
 class TestFlatBuffersReadBack:
     """Tests for reading back FlatBuffers data."""
 
-    def test_read_ecu_short_name(self) -> None:
+    def test_read_ecu_short_name(self, full_yaml_file: Path) -> None:
         """Should read ECU short name from FlatBuffers."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(FULL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(full_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -215,13 +194,9 @@ class TestFlatBuffersReadBack:
             short_name = short_name.decode("utf-8") if isinstance(short_name, bytes) else short_name
             assert short_name == ir_db.ecu_name
 
-    def test_read_diag_services(self) -> None:
+    def test_read_diag_services(self, full_yaml_file: Path) -> None:
         """Should read diagnostic services from FlatBuffers."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(FULL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(full_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -242,13 +217,9 @@ class TestFlatBuffersReadBack:
             short_name = diag_comm.ShortName()
             assert short_name is not None
 
-    def test_read_dops(self) -> None:
+    def test_read_dops(self, full_yaml_file: Path) -> None:
         """Should read DOPs (Data Object Properties) from FlatBuffers."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(FULL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(full_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -265,13 +236,9 @@ class TestFlatBuffersReadBack:
 class TestMDDContainerIntegrity:
     """Tests for MDD protobuf container integrity."""
 
-    def test_mdd_version_present(self) -> None:
+    def test_mdd_version_present(self, minimal_yaml_file: Path) -> None:
         """MDD should have version set."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(MINIMAL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(minimal_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -283,13 +250,9 @@ class TestMDDContainerIntegrity:
 
         assert mdd.version == "1.2.3"
 
-    def test_mdd_chunk_type_correct(self) -> None:
+    def test_mdd_chunk_type_correct(self, minimal_yaml_file: Path) -> None:
         """MDD chunk should have correct type."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(MINIMAL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(minimal_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -305,13 +268,9 @@ class TestMDDContainerIntegrity:
         assert mdd.chunks[0].type == Chunk.DIAGNOSTIC_DESCRIPTION
         assert mdd.chunks[0].name == "diagnostic_description"
 
-    def test_mdd_chunk_mimetype(self) -> None:
+    def test_mdd_chunk_mimetype(self, minimal_yaml_file: Path) -> None:
         """MDD chunk should have correct MIME type."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(MINIMAL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(minimal_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -323,13 +282,9 @@ class TestMDDContainerIntegrity:
 
         assert mdd.chunks[0].mimeType == "application/x-flatbuffers"
 
-    def test_mdd_schema_metadata(self) -> None:
+    def test_mdd_schema_metadata(self, minimal_yaml_file: Path) -> None:
         """MDD chunk should reference FlatBuffers schema."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(MINIMAL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(minimal_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -345,13 +300,9 @@ class TestMDDContainerIntegrity:
 class TestCompressionRoundTrip:
     """Tests for compression round-trip integrity."""
 
-    def test_gzip_preserves_data(self) -> None:
+    def test_gzip_preserves_data(self, full_yaml_file: Path) -> None:
         """Gzip compression should preserve all data."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(FULL_YAML, f)
-            yaml_path = Path(f.name)
-
-        doc = load_diagnostic_description(yaml_path)
+        doc = load_diagnostic_description(full_yaml_file)
         transformer = YamlToIRTransformer()
         ir_db = transformer.transform(doc)
 
@@ -1,10 +1,12 @@
 """Tests for MDD writer."""
 
+import io
 import tempfile
 from pathlib import Path
 from typing import Any
 
 import pytest
+from yaml_to_mdd.converters.flatbuffers_converter import IRToFlatBuffersConverter
 from yaml_to_mdd.converters.mdd_writer import FILE_MAGIC, MDDWriter, convert_yaml_to_mdd
 from yaml_to_mdd.ir.database import IRDatabase
 from yaml_to_mdd.ir.services import IRDiagService, IRParam, IRRequest
@@ -48,6 +50,16 @@ class TestMDDWriterBasics:
         assert isinstance(result, bytes)
         assert len(result) > 0
 
+    def test_write_to_stream(self, minimal_db: IRDatabase) -> None:
+        """Should stream the same bytes as write_bytes and report their count."""
+        writer = MDDWriter(compression=None)
+        stream = io.BytesIO()
+
+        written = writer.write_to(stream, minimal_db)
+
+        assert stream.getvalue() == writer.write_bytes(minimal_db)
+        assert written == stream.tell()
+
     def test_write_file(self, minimal_db: IRDatabase) -> None:
         """Should write MDD file."""
         writer = MDDWriter()
@@ -59,6 +71,17 @@ class TestMDDWriterBasics:
             assert output_path.exists()
             assert output_path.stat().st_size > 0
 
+    def test_failed_write_keeps_existing_file(self, minimal_db: IRDatabase, tmp_path: Path) -> None:
+        """Should leave an existing file untouched when serialization fails."""
+        output_path = tmp_path / "test.mdd"
+        output_path.write_bytes(b"previous")
+        writer = MDDWriter(compression="unknown")
+
+        with pytest.raises(ValueError, match="Unknown compression"):
+            writer.write(minimal_db, output_path)
+
+        assert output_path.read_bytes() == b"previous"
+
     def test_write_creates_parent_dirs(self, minimal_db: IRDatabase) -> None:
         """Should create parent directories if needed."""
         writer = MDDWriter()
@@ -168,6 +191,29 @@ class TestMDDWriterCompression:
         assert chunk.compression_algorithm == "gzip"
         assert chunk.uncompressed_size > 0
 
+    def test_gzip_readable_by_stdlib(self, minimal_db: IRDatabase) -> None:
+        """Gzip chunks should decompress with the stdlib gzip module."""
+        import gzip
+
+        writer = MDDWriter(compression="gzip")
+        mdd_bytes = writer.write_bytes(minimal_db)
+
+        mdd = MDDFile()
+        mdd.ParseFromString(mdd_bytes[len(FILE_MAGIC) :])
+
+        chunk = mdd.chunks[0]
+        assert gzip.decompress(chunk.data) == IRToFlatBuffersConverter().convert(minimal_db)
+
+    def test_prebuilt_payload_reused(self, minimal_db: IRDatabase) -> None:
+        """Should wrap a pre-built FlatBuffers payload exactly like a fresh conversion."""
+        fbs_bytes = IRToFlatBuffersConverter().convert(minimal_db)
+
+        for compression in (None, "lzma"):
+            writer = MDDWriter(compression=compression)
+            assert writer.write_bytes(minimal_db, fbs_bytes=fbs_bytes) == writer.write_bytes(
+                minimal_db
+            )
+
     def test_gzip_compressed_is_smaller(self) -> None:
         """Gzip compressed data should be different (usually smaller for large data)."""
         # Create larger database for better compression test
@@ -260,13 +306,13 @@ class TestConvertYamlToMddFunction:
     """Tests for high-level convert function."""
 
     @pytest.fixture
-    def yaml_file(self, valid_base_data: dict[str, Any]) -> Path:
+    def yaml_file(self, valid_base_data: dict[str, Any], tmp_path: Path) -> Path:
         """Create a temporary YAML file."""
         import yaml
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(valid_base_data, f)
-            return Path(f.name)
+        path = tmp_path / "input.yaml"
+        path.write_text(yaml.dump(valid_base_data))
+        return path
 
     def test_convert_yaml_to_mdd(self, yaml_file: Path) -> None:
         """Should convert YAML file to MDD."""
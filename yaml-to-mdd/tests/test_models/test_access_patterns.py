@@ -42,6 +42,20 @@ class TestAccessPattern:
         assert pattern.requires_session("extended") is True
         assert pattern.requires_session("default") is False
 
+    def test_sessions_and_security_lists(self) -> None:
+        """Should expose required names, or None for 'any'/'none'."""
+        open_pattern = AccessPattern(sessions="any", security="none", authentication="none")
+        assert open_pattern.sessions_list is None
+        assert open_pattern.security_list is None
+
+        pattern = AccessPattern(
+            sessions=["extended"],
+            security=["level_1"],
+            authentication="none",
+        )
+        assert pattern.sessions_list == ["extended"]
+        assert pattern.security_list == ["level_1"]
+
     def test_single_session_string_converted_to_list(self) -> None:
         """Should convert single session string to list."""
         pattern = AccessPattern(
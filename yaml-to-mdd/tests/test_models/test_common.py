@@ -1,5 +1,7 @@
 """Tests for common types and validators."""
 
+import sys
+
 import pytest
 from pydantic import BaseModel, ValidationError
 from yaml_to_mdd.models.common import (
@@ -8,6 +10,7 @@ from yaml_to_mdd.models.common import (
     HexInt16,
     HexInt24,
     HexInt32,
+    InternedStr,
     parse_hex_int,
     serialize_hex_int,
 )
@@ -208,3 +211,21 @@ class TestHexInt32:
 
         with pytest.raises(ValidationError):
             MyModel(value=4294967296)
+
+
+class TestInternedStr:
+    """Tests for InternedStr."""
+
+    def test_value_interned(self) -> None:
+        """Should return the interned copy of equal strings."""
+
+        class MyModel(BaseModel):
+            names: dict[InternedStr, InternedStr]
+
+        key = "".join(["Engine", "Temp"])
+        value = "".join(["u", "16"])
+        model = MyModel(names={key: value})
+
+        ((loaded_key, loaded_value),) = model.names.items()
+        assert loaded_key is sys.intern("EngineTemp")
+        assert loaded_value is sys.intern("u16")
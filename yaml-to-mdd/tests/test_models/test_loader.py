@@ -4,6 +4,7 @@ from pathlib import Path
 from textwrap import dedent
 
 import pytest
+import yaml
 from yaml_to_mdd.models.loader import (
     LoaderError,
     load_yaml_file,
@@ -22,6 +23,20 @@ class TestLoadYamlFile:
         data = load_yaml_file(yaml_file)
         assert data == {"key": "value", "number": 42}
 
+    def test_matches_pure_python_safe_loader(self, tmp_path: Path) -> None:
+        """Should parse hex strings, dates and flow lists like yaml.SafeLoader."""
+        text = dedent("""\
+            created: 2024-01-15
+            id: "0x01"
+            raw: 0x0E80
+            sessions: [default, extended]
+            security: none
+        """)
+        yaml_file = tmp_path / "test.yaml"
+        yaml_file.write_text(text)
+
+        assert load_yaml_file(yaml_file) == yaml.load(text, Loader=yaml.SafeLoader)
+
     def test_load_valid_json(self, tmp_path: Path) -> None:
         """Should load valid JSON file."""
         json_file = tmp_path / "test.json"
@@ -366,6 +366,29 @@ class TestYamlToIRTransformerComplex:
         assert len(result1.dops) == len(result2.dops)
         assert len(result1.services) == len(result2.services)
 
+    def test_transform_reused_does_not_leak_types(
+        self, valid_base_data: dict[str, Any]
+    ) -> None:
+        """A reused transformer should not resolve types from an earlier document."""
+        did = {"name": "Temp", "type": "temperature", "access": "read"}
+        with_type = DiagnosticDescription.model_validate(
+            {
+                **valid_base_data,
+                "types": {"temperature": {"base": "u16"}},
+                "dids": {"0xF100": did},
+            }
+        )
+        without_type = DiagnosticDescription.model_validate(
+            {**valid_base_data, "dids": {"0xF100": did}}
+        )
+        transformer = YamlToIRTransformer()
+
+        transformer.transform(with_type)
+        reused = transformer.transform(without_type)
+        fresh = YamlToIRTransformer().transform(without_type)
+
+        assert reused.services == fresh.services
+
     def test_transform_with_sessions(self, valid_base_data: dict[str, Any]) -> None:
         """Should capture session mappings."""
         doc = DiagnosticDescription.model_validate(valid_base_data)
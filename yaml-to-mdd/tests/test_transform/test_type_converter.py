@@ -1,6 +1,6 @@
 """Tests for type converter."""
 
-
+import pytest
 from yaml_to_mdd.ir.types import (
     IRCompuCategory,
     IRDataType,
@@ -78,6 +78,25 @@ class TestCreateCompuMethodForType:
         scale_1 = next(s for s in result.scales if s.internal_value == 1)
         assert scale_1.text_value == "ACTIVE"
 
+    def test_text_table_string_keys(self) -> None:
+        """TEXT_TABLE should parse hex and decimal string keys."""
+        type_def = TypeDefinition(
+            base=BaseType.U8,
+            enum={"0x0A": "TEN", "11": "ELEVEN", 12: "TWELVE", "07": "SEVEN"},
+        )
+        result = create_compu_method_for_type(type_def)
+
+        assert result is not None
+        assert [s.internal_value for s in result.scales] == [10, 11, 12, 7]
+
+    @pytest.mark.parametrize("key", ["0b101", "0o17", "0X1F", "-0x10"])
+    def test_text_table_rejects_other_prefixed_keys(self, key: str) -> None:
+        """TEXT_TABLE should only accept a lowercase "0x" prefix on string keys."""
+        type_def = TypeDefinition(base=BaseType.U8, enum={key: "VALUE"})
+
+        with pytest.raises(ValueError):
+            create_compu_method_for_type(type_def)
+
 
 class TestCreateDiagCodedType:
     """Tests for create_diag_coded_type."""
@@ -1,7 +1,13 @@
 """Tests for consistency validators."""
 
 from yaml_to_mdd.models.root import DiagnosticDescription
-from yaml_to_mdd.validation.errors import ErrorCodes
+from yaml_to_mdd.validation.consistency_validators import (
+    DIDRangeValidator,
+    DTCFormatValidator,
+    UniqueSecurityLevelValidator,
+    _classify_did,
+)
+from yaml_to_mdd.validation.errors import ErrorCodes, ValidationResult
 from yaml_to_mdd.validation.validator import DiagnosticValidator
 
 
@@ -68,6 +74,24 @@ class TestUniqueSecurityLevelValidator:
         assert len(mismatch_warnings) == 1
         assert "doesn't match expected" in mismatch_warnings[0].message
 
+    def test_duplicate_seed_and_key_fail(
+        self, doc_with_valid_security: DiagnosticDescription
+    ) -> None:
+        """Should error once per duplicated seed_request and key_send."""
+        level = doc_with_valid_security.security["level_1"]
+        doc = doc_with_valid_security.model_copy(
+            update={"security": {"level_1": level, "level_1_copy": level}}
+        )
+        result = ValidationResult()
+        UniqueSecurityLevelValidator().validate(doc, result)
+
+        paths = [e.location.path for e in result.errors if e.location is not None]
+        assert paths == [
+            "security.level_1_copy.seed_request",
+            "security.level_1_copy.key_send",
+        ]
+        assert "already used by 'level_1'" in result.errors[0].message
+
 
 class TestDIDRangeValidator:
     """Tests for DIDRangeValidator."""
@@ -80,6 +104,35 @@ class TestDIDRangeValidator:
         did_errors = [e for e in result.errors if e.code == ErrorCodes.E201_INVALID_DID_ADDRESS]
         assert len(did_errors) == 0
 
+    def test_out_of_range_did_addresses_fail(
+        self, doc_with_valid_dids: DiagnosticDescription
+    ) -> None:
+        """Should error for DID addresses outside 0x0000-0xFFFF, including negatives."""
+        did_def = doc_with_valid_dids.dids[0xF190]
+        doc = doc_with_valid_dids.model_copy(
+            update={"dids": {0xFFFF: did_def, 0x10000: did_def, -1: did_def}}
+        )
+        result = ValidationResult()
+        DIDRangeValidator().validate(doc, result)
+
+        paths = [e.location.path for e in result.errors if e.location is not None]
+        assert paths == ["dids.0x10000", "dids.-0x001"]
+
+    def test_classify_known_ranges(self) -> None:
+        """Should return the category label for addresses inside a range."""
+        assert _classify_did(0x0000) == "ISO Reserved"
+        assert _classify_did(0xF190) == "Vehicle Identification"
+        assert _classify_did(0xF1FF) == "Vehicle Identification"
+        assert _classify_did(0xFD00) == "Reserved for OBD"
+        assert _classify_did(0xFFFF) == "ISO Reserved"
+
+    def test_classify_unknown_addresses(self) -> None:
+        """Should return None for gaps between ranges and out-of-range values."""
+        assert _classify_did(0x0300) is None
+        assert _classify_did(0xEFFF) is None
+        assert _classify_did(-1) is None
+        assert _classify_did(0x10000) is None
+
 
 class TestDTCFormatValidator:
     """Tests for DTCFormatValidator."""
@@ -92,6 +145,18 @@ class TestDTCFormatValidator:
         dtc_errors = [e for e in result.errors if e.code == ErrorCodes.E302_INVALID_DTC_FORMAT]
         assert len(dtc_errors) == 0
 
+    def test_invalid_dtc_prefix_fail(
+        self, doc_with_dtc_valid_prefix: DiagnosticDescription
+    ) -> None:
+        """Should error when the SAE code prefix is not P/B/C/U."""
+        dtc = doc_with_dtc_valid_prefix.dtcs[0x010203].model_copy(update={"sae": "X0123"})
+        doc = doc_with_dtc_valid_prefix.model_copy(update={"dtcs": {0x010203: dtc}})
+        result = ValidationResult()
+        DTCFormatValidator().validate(doc, result)
+
+        assert len(result.errors) == 1
+        assert "invalid prefix 'X'" in result.errors[0].message
+
 
 class TestUnusedDefinitionsValidator:
     """Tests for UnusedDefinitionsValidator."""
@@ -117,3 +182,15 @@ class TestUnusedDefinitionsValidator:
             if w.code == ErrorCodes.W001_UNUSED_TYPE and "VIN" in w.message
         ]
         assert len(unused_warnings) == 0
+
+    def test_only_unused_types_warned(self, doc_with_valid_dids: DiagnosticDescription) -> None:
+        """Should warn only about types not referenced by any DID."""
+        validator = DiagnosticValidator()
+        result = validator.validate(doc_with_valid_dids)
+
+        unused_paths = [
+            w.location.path
+            for w in result.warnings
+            if w.code == ErrorCodes.W001_UNUSED_TYPE and w.location is not None
+        ]
+        assert unused_paths == ["types.Temperature"]
@@ -1,5 +1,7 @@
 """Tests for validation error types."""
 
+import dataclasses
+
 import pytest
 from yaml_to_mdd.validation.errors import (
     ErrorCodes,
@@ -34,6 +36,18 @@ class TestValidationLocation:
         with pytest.raises(AttributeError):
             loc.path = "new"  # type: ignore[misc]
 
+    def test_path_interned(self) -> None:
+        """Should share one string object between equal paths."""
+        prefix = "dids."
+        loc_a = ValidationLocation(path=prefix + "0xF190")
+        loc_b = ValidationLocation(path=prefix + "0xF190")
+        assert loc_a.path is loc_b.path
+
+    def test_uses_slots(self) -> None:
+        """Should not allocate a per-instance __dict__."""
+        loc = ValidationLocation(path="test")
+        assert not hasattr(loc, "__dict__")
+
 
 class TestValidationIssue:
     """Tests for ValidationIssue."""
@@ -82,6 +96,27 @@ class TestValidationIssue:
         with pytest.raises(AttributeError):
             issue.code = "E002"  # type: ignore[misc]
 
+    def test_replace_updates_message(self) -> None:
+        """Should support dataclasses.replace on the message field."""
+        issue = ValidationIssue(
+            code="W001",
+            message="Type 'Temp' is defined but never used",
+            severity=ValidationSeverity.WARNING,
+        )
+        updated = dataclasses.replace(issue, message="Type 'Raw' is defined but never used")
+        assert updated.message == "Type 'Raw' is defined but never used"
+        assert updated.code == issue.code
+
+    def test_equal_issues_compare_equal(self) -> None:
+        """Should compare issues with the same fields as equal."""
+        first = ValidationIssue(
+            code="W001", message="100% used", severity=ValidationSeverity.WARNING
+        )
+        second = ValidationIssue(
+            code="W001", message="100% used", severity=ValidationSeverity.WARNING
+        )
+        assert first == second
+
 
 class TestValidationResult:
     """Tests for ValidationResult."""
@@ -168,6 +203,80 @@ class TestValidationResult:
         assert len(result1.errors) == 2
         assert len(result1.warnings) == 1
 
+    def test_counts_track_added_issues(self) -> None:
+        """Should keep error/warning counts in sync across add, extend and merge."""
+        result = ValidationResult()
+        result.add_error("E001", "Error", "path")
+        result.extend(
+            [ValidationIssue(code="W001", message="Warning", severity=ValidationSeverity.WARNING)]
+        )
+
+        other = ValidationResult()
+        other.add_error("E002", "Error", "path")
+        other.add_warning("W002", "Warning", "path")
+        result.merge(other)
+
+        assert result.error_count == len(result.errors) == 2
+        assert result.warning_count == len(result.warnings) == 2
+        assert result.is_valid is False
+
+    def test_counts_from_constructor(self) -> None:
+        """Should count issues passed to the constructor."""
+        issue = ValidationIssue(code="E001", message="Error", severity=ValidationSeverity.ERROR)
+        result = ValidationResult(issues=[issue])
+
+        assert result.error_count == 1
+        assert result.is_valid is False
+
+    def test_errors_and_warnings_keep_order(self) -> None:
+        """Should return per-severity issues in insertion order as independent lists."""
+        result = ValidationResult()
+        result.add_error("E001", "First", "a")
+        result.add_warning("W001", "Warning", "b")
+        result.add_error("E002", "Second", "c")
+
+        assert [e.code for e in result.errors] == ["E001", "E002"]
+        assert [w.code for w in result.warnings] == ["W001"]
+
+        result.errors.clear()
+        assert result.error_count == 2
+
+    def test_extend(self) -> None:
+        """Should add pre-built issues in order."""
+        result = ValidationResult()
+        result.extend(
+            ValidationIssue(code=code, message="Issue", severity=severity)
+            for code, severity in (
+                ("E001", ValidationSeverity.ERROR),
+                ("W001", ValidationSeverity.WARNING),
+            )
+        )
+
+        assert [i.code for i in result.issues] == ["E001", "W001"]
+        assert len(result.errors) == 1
+        assert len(result.warnings) == 1
+
+    def test_issues_read_only(self) -> None:
+        """Should not allow issues to bypass the per-severity lists."""
+        result = ValidationResult()
+        result.add_error("E001", "Error", "path")
+
+        assert isinstance(result.issues, tuple)
+        with pytest.raises(AttributeError):
+            result.issues.append(result.issues[0])  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            result.issues = []  # type: ignore[misc]
+
+    def test_results_with_same_issues_compare_equal(self) -> None:
+        """Should compare results by their issues."""
+        first = ValidationResult()
+        second = ValidationResult()
+        first.add_error("E001", "Error", "path")
+        second.add_error("E001", "Error", "path")
+
+        assert first == second
+        assert first != ValidationResult()
+
 
 class TestErrorCodes:
     """Tests for ErrorCodes constants."""
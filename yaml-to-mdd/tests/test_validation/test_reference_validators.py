@@ -1,7 +1,16 @@
 """Tests for reference validators."""
 
+from yaml_to_mdd.models.access_patterns import AccessPattern
 from yaml_to_mdd.models.root import DiagnosticDescription
-from yaml_to_mdd.validation.errors import ErrorCodes
+from yaml_to_mdd.models.routines import RoutineDefinition
+from yaml_to_mdd.validation.errors import ErrorCodes, ValidationResult
+from yaml_to_mdd.validation.reference_validators import (
+    AccessPatternReferenceValidator,
+    FusedReferenceValidator,
+    SecurityReferenceValidator,
+    SessionReferenceValidator,
+    TypeReferenceValidator,
+)
 from yaml_to_mdd.validation.validator import DiagnosticValidator
 
 
@@ -25,6 +34,23 @@ class TestTypeReferenceValidator:
         assert len(type_errors) == 1
         assert "UndefinedType" in type_errors[0].message
 
+    def test_available_types_shared_and_sorted(
+        self, doc_with_valid_dids: DiagnosticDescription
+    ) -> None:
+        """Should attach one sorted tuple of defined types to every E001 error."""
+        dids = {
+            addr: did_def.model_copy(update={"type": "Missing"})
+            for addr, did_def in doc_with_valid_dids.dids.items()
+        }
+        doc = doc_with_valid_dids.model_copy(update={"dids": dids})
+        result = ValidationResult()
+        TypeReferenceValidator().validate(doc, result)
+
+        assert len(result.errors) == 2
+        first, second = (e.context["available_types"] for e in result.errors)
+        assert first == ("Temperature", "VIN")
+        assert first is second
+
     def test_builtin_types_always_valid(self, minimal_doc: DiagnosticDescription) -> None:
         """Should accept all builtin types without definitions."""
         from yaml_to_mdd.models.dids import DIDDefinition
@@ -110,6 +136,23 @@ class TestSecurityReferenceValidator:
         security_errors = [e for e in result.errors if e.code == ErrorCodes.E003_UNDEFINED_SECURITY]
         assert len(security_errors) == 0
 
+    def test_sentinels_accepted_inside_lists(
+        self, doc_with_valid_security: DiagnosticDescription
+    ) -> None:
+        """Should accept 'any'/'none' listed next to defined names."""
+        pattern = AccessPattern(
+            sessions=["any", "extended"],
+            security=["none", "level_1", "missing"],
+            authentication="none",
+        )
+        doc = doc_with_valid_security.model_copy(update={"access_patterns": {"mixed": pattern}})
+        result = ValidationResult()
+        SessionReferenceValidator().validate(doc, result)
+        SecurityReferenceValidator().validate(doc, result)
+
+        assert [e.code for e in result.errors] == [ErrorCodes.E003_UNDEFINED_SECURITY]
+        assert "'missing'" in result.errors[0].message
+
 
 class TestAccessPatternReferenceValidator:
     """Tests for AccessPatternReferenceValidator."""
@@ -134,3 +177,51 @@ class TestAccessPatternReferenceValidator:
         ap_errors = [e for e in result.errors if e.code == ErrorCodes.E004_UNDEFINED_ACCESS_PATTERN]
         assert len(ap_errors) == 1
         assert "nonexistent_pattern" in ap_errors[0].message
+
+    def test_undefined_routine_access_pattern_extra_key(
+        self, doc_with_valid_dids: DiagnosticDescription
+    ) -> None:
+        """Should error when a routine's extra access_pattern key is undefined."""
+        routine = RoutineDefinition.model_validate(
+            {
+                "name": "Self Test",
+                "access": "public",
+                "operations": ["start"],
+                "access_pattern": "nonexistent_pattern",
+            }
+        )
+        doc = doc_with_valid_dids.model_copy(update={"routines": {0xFF01: routine}})
+        result = ValidationResult()
+        AccessPatternReferenceValidator().validate(doc, result)
+
+        assert [e.location.path for e in result.errors if e.location is not None] == [
+            f"routines.{0xFF01}.access_pattern"
+        ]
+
+
+class TestFusedReferenceValidator:
+    """Tests for FusedReferenceValidator."""
+
+    def test_matches_separate_validators(
+        self, doc_with_undefined_access_pattern: DiagnosticDescription
+    ) -> None:
+        """Should report the same issues as the type and access pattern validators."""
+        did_def = doc_with_undefined_access_pattern.dids[0xF190]
+        doc = doc_with_undefined_access_pattern.model_copy(
+            update={
+                "dids": {
+                    0xF190: did_def,
+                    0xF191: did_def.model_copy(update={"type": "UndefinedType"}),
+                }
+            }
+        )
+
+        separate = ValidationResult()
+        TypeReferenceValidator().validate(doc, separate)
+        AccessPatternReferenceValidator().validate(doc, separate)
+
+        fused = ValidationResult()
+        FusedReferenceValidator().validate(doc, fused)
+
+        assert len(fused.errors) == 3
+        assert sorted(map(str, fused.issues)) == sorted(map(str, separate.issues))
@@ -2,7 +2,15 @@
 
 import pytest
 from yaml_to_mdd.models.root import DiagnosticDescription
+from yaml_to_mdd.validation.base import (
+    BUILTIN_TYPES,
+    BaseValidator,
+    CompositeValidator,
+    IndexedValidator,
+    SchemaIndex,
+)
 from yaml_to_mdd.validation.errors import ValidationResult
+from yaml_to_mdd.validation.reference_validators import TypeReferenceValidator
 from yaml_to_mdd.validation.validator import DiagnosticValidator, ValidationError
 
 
@@ -31,6 +39,117 @@ class TestDiagnosticValidator:
         assert not result.is_valid
         assert len(result.errors) > 0
 
+    def test_instances_share_validators(
+        self, doc_with_undefined_type: DiagnosticDescription
+    ) -> None:
+        """Should reuse the validator instances across instances with independent results."""
+        strict = DiagnosticValidator(strict=True)
+        lenient = DiagnosticValidator()
+
+        assert strict._validator.validators == lenient._validator.validators
+        first = strict.validate(doc_with_undefined_type)
+        second = lenient.validate(doc_with_undefined_type)
+        assert first is not second
+        assert first.issues == second.issues
+
+    def test_added_validator_stays_on_its_instance(
+        self, doc_with_undefined_type: DiagnosticDescription
+    ) -> None:
+        """Should not change other instances' pipelines when one instance gains a validator."""
+        extended = DiagnosticValidator()
+        default = DiagnosticValidator()
+
+        extended._validator.add(TypeReferenceValidator())
+
+        # The fused validator already reports each undefined type once
+        assert len(extended.validate(doc_with_undefined_type).errors) == 2
+        assert len(default.validate(doc_with_undefined_type).errors) == 1
+
+
+class TestCompositeValidator:
+    """Tests for CompositeValidator dispatch."""
+
+    def test_add_after_validate_runs_new_validator(
+        self, doc_with_undefined_type: DiagnosticDescription
+    ) -> None:
+        """Validators added after a validate() call should run on the next call."""
+        composite = CompositeValidator()
+        first = ValidationResult()
+        composite.validate(doc_with_undefined_type, first)
+        assert first.issues == ()
+
+        composite.add(TypeReferenceValidator())
+        second = ValidationResult()
+        composite.validate(doc_with_undefined_type, second)
+        assert len(second.errors) == 1
+
+    def test_validators_cannot_be_changed_in_place(self) -> None:
+        """Should expose validators as a tuple so only add() can change the pipeline."""
+        validator = TypeReferenceValidator()
+        composite = CompositeValidator([validator])
+
+        assert composite.validators == (validator,)
+        with pytest.raises(AttributeError):
+            composite.validators = []  # type: ignore[misc]
+
+    def test_two_argument_validator_runs(self, minimal_doc: DiagnosticDescription) -> None:
+        """Validators that only implement validate(doc, result) should still run."""
+        seen: list[DiagnosticDescription] = []
+
+        class LegacyValidator(BaseValidator):
+            def validate(self, doc: DiagnosticDescription, result: ValidationResult) -> None:
+                seen.append(doc)
+
+        CompositeValidator([LegacyValidator()]).validate(minimal_doc, ValidationResult())
+
+        assert seen == [minimal_doc]
+
+    def test_indexed_validators_share_one_index(self, minimal_doc: DiagnosticDescription) -> None:
+        """Should build the index once and pass it to every indexed validator."""
+        seen: list[SchemaIndex] = []
+
+        class RecordingValidator(IndexedValidator):
+            def validate_indexed(
+                self, doc: DiagnosticDescription, result: ValidationResult, index: SchemaIndex
+            ) -> None:
+                seen.append(index)
+
+        composite = CompositeValidator([RecordingValidator(), RecordingValidator()])
+        composite.validate(minimal_doc, ValidationResult())
+
+        assert len(seen) == 2
+        assert seen[0] is seen[1]
+
+
+class TestSchemaIndex:
+    """Tests for SchemaIndex."""
+
+    def test_from_doc(self, doc_with_valid_security: DiagnosticDescription) -> None:
+        """Should collect the defined names of each section."""
+        index = SchemaIndex.from_doc(doc_with_valid_security)
+
+        assert index.defined_types == frozenset()
+        assert index.defined_sessions == {"default", "extended"}
+        assert index.defined_security == {"level_1"}
+        assert index.defined_patterns == {"secured"}
+
+    def test_defined_types_exclude_builtins(self, doc_with_types: DiagnosticDescription) -> None:
+        """Should hold only the document's own types, not the builtins."""
+        index = SchemaIndex.from_doc(doc_with_types)
+
+        assert index.defined_types == {"VIN", "Temperature"}
+        assert index.defined_types.isdisjoint(BUILTIN_TYPES)
+
+    def test_did_refs(self, doc_with_valid_dids: DiagnosticDescription) -> None:
+        """Should extract each DID's named type and access pattern once."""
+        index = SchemaIndex.from_doc(doc_with_valid_dids)
+
+        assert index.did_refs == (
+            (0xF190, "VIN", "standard_read"),
+            (0xF191, "u8", None),
+        )
+        assert index.routine_param_refs == ()
+
 
 class TestValidateAndRaise:
     """Tests for validate_and_raise method."""
@@ -92,6 +211,21 @@ class TestValidationError:
         formatted = exc_info.value.format_issues()
         assert "ERROR:" in formatted
 
+    def test_formatted_output_stable(self, doc_with_undefined_type: DiagnosticDescription) -> None:
+        """Should return the same format_issues and errors_only output on every call."""
+        validator = DiagnosticValidator()
+
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate_and_raise(doc_with_undefined_type)
+
+        error = exc_info.value
+        expected_errors = tuple(str(issue) for issue in error.result.errors)
+        first_formatted = error.format_issues()
+
+        assert error.errors_only == expected_errors
+        assert error.format_issues() == first_formatted
+        assert error.errors_only == expected_errors
+
     def test_result_property(self, doc_with_undefined_type: DiagnosticDescription) -> None:
         """Should have result property with ValidationResult."""
         validator = DiagnosticValidator()
@@ -103,13 +237,13 @@ class TestValidationError:
         assert len(exc_info.value.result.errors) > 0
 
     def test_errors_only_property(self, doc_with_undefined_type: DiagnosticDescription) -> None:
-        """errors_only should return list of error messages."""
+        """errors_only should return a tuple of error messages."""
         validator = DiagnosticValidator()
 
         with pytest.raises(ValidationError) as exc_info:
             validator.validate_and_raise(doc_with_undefined_type)
 
         errors = exc_info.value.errors_only
-        assert isinstance(errors, list)
+        assert isinstance(errors, tuple)
         assert len(errors) > 0
         assert all(isinstance(e, str) for e in errors)